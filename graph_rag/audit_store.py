@@ -1,15 +1,28 @@
 # graph_rag/audit_store.py
 
-import json
+import atexit
 import os
+import queue
+import threading
 
 from graph_rag.observability import get_logger
+from graph_rag.utils import append_to_file, json_dumps_line
 
 logger = get_logger(__name__)
 
+# Entries are appended by a background writer; whatever is queued when it
+# wakes up (up to AUDIT_FLUSH_BATCH) goes out in a single write
+AUDIT_QUEUE_MAXSIZE = 4096
+AUDIT_FLUSH_BATCH = 256
+# How long record() waits for room in a full queue before writing through
+AUDIT_PUT_TIMEOUT_S = 5.0
+
 class AuditStore:
     def __init__(self, log_file: str = "audit_log.jsonl"):
         self.log_file = log_file
+        self._queue: queue.Queue = queue.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
         self._ensure_log_file_exists()
 
     def _ensure_log_file_exists(self):
@@ -18,8 +31,73 @@ class AuditStore:
                 pass # Create an empty file if it doesn't exist
 
     def record(self, entry: dict):
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(entry) + '\n')
+        """
+        Queue ``entry`` for the background writer.
+
+        Blocks for up to AUDIT_PUT_TIMEOUT_S when the writer falls behind, so
+        async code should call it through a thread (asyncio.to_thread).
+        """
+        # Serialize on the caller's thread so later mutation of ``entry`` can't leak in
+        line = json_dumps_line(entry)
+        # Checking the writer and enqueueing under one lock keeps close() from
+        # stopping the writer between the two, which would strand the entry
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._writer.start()
+            try:
+                # Waiting for room keeps entries in order behind those already queued
+                self._queue.put(line, timeout=AUDIT_PUT_TIMEOUT_S)
+            except queue.Full:
+                # Audit entries are never dropped, even if the writer is stuck
+                logger.error(f"Audit queue full for {AUDIT_PUT_TIMEOUT_S}s; writing entry through out of order")
+                self._write([line])
+
+    def flush(self):
+        """Block until every queued entry has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Flush queued entries and stop the writer; a later record() starts a new one."""
+        with self._writer_lock:
+            if self._writer is None:
+                return
+            # Join under the lock so a new writer can't start and take the sentinel
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _run(self):
+        while True:
+            line = self._queue.get()
+            if line is None:
+                self._queue.task_done()
+                return
+            batch = [line]
+            stop = False
+            while len(batch) < AUDIT_FLUSH_BATCH:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                batch.append(line)
+            self._write(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, lines: list[bytes]):
+        payload = b''.join(lines)
+        try:
+            append_to_file(self.log_file, payload)
+        except OSError as e:
+            logger.error(f"Failed to write {len(lines)} audit entries to {self.log_file}: {e}")
 
 # Global instance for easy access, can be mocked in tests
 audit_store = AuditStore()
+# The writer is a daemon thread; drain it before the interpreter exits
+atexit.register(audit_store.close)
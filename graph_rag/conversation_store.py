@@ -1,7 +1,11 @@
 # graph_rag/conversation_store.py
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
+from graph_rag.utils import append_to_file, json_dumps_line, json_loads
+
+# Conversation files are read concurrently at startup (pure file I/O)
+INIT_LOAD_WORKERS = 8
 
 class ConversationStore:
     def __init__(self, storage_dir: str = "conversations"):
@@ -17,18 +21,30 @@ class ConversationStore:
 
     def init(self):
         """Initializes the conversation store by loading existing conversations."""
-        for filename in os.listdir(self.storage_dir):
-            if filename.startswith("conv_") and filename.endswith(".jsonl"):
-                conversation_id = filename[len("conv_"):-len(".jsonl")]
-                self.conversations[conversation_id] = self._load_conversation(conversation_id)
+        conversation_ids = [
+            filename[len("conv_"):-len(".jsonl")]
+            for filename in os.listdir(self.storage_dir)
+            if filename.startswith("conv_") and filename.endswith(".jsonl")
+        ]
+        if len(conversation_ids) <= 1:
+            loaded = map(self._load_conversation, conversation_ids)
+        else:
+            # Overlap file reads; results come back in listing order
+            with ThreadPoolExecutor(max_workers=min(INIT_LOAD_WORKERS, len(conversation_ids))) as executor:
+                loaded = list(executor.map(self._load_conversation, conversation_ids))
+        for conversation_id, messages in zip(conversation_ids, loaded):
+            self.conversations[conversation_id] = messages
 
     def _load_conversation(self, conversation_id: str) -> List[Dict]:
         filepath = self._get_conversation_file(conversation_id)
         messages = []
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
+        try:
+            # Both parsers take the raw UTF-8 bytes, so skip the text decode
+            with open(filepath, 'rb') as f:
                 for line in f:
-                    messages.append(json.loads(line))
+                    messages.append(json_loads(line))
+        except FileNotFoundError:
+            pass
         return messages
 
     def add_message(self, conversation_id: str, message: Dict):
@@ -39,8 +55,8 @@ class ConversationStore:
 
     def _persist_message(self, conversation_id: str, message: Dict):
         filepath = self._get_conversation_file(conversation_id)
-        with open(filepath, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(message) + '\n')
+        # Serialized up front and appended as one record at the end of the file
+        append_to_file(filepath, json_dumps_line(message))
 
     def get_history(self, conversation_id: str) -> List[Dict]:
         return self.conversations.get(conversation_id, [])
@@ -1,8 +1,12 @@
 # graph_rag/cypher_generator.py
-import json
+import mmap
+import os
 import re
+import sys
 import yaml
+from types import MappingProxyType
 from graph_rag.observability import get_logger
+from graph_rag.utils import json_loads
 
 logger = get_logger(__name__)
 
@@ -12,25 +16,104 @@ RELATIONSHIP_TYPE_REGEX = re.compile(r"^[A-Z_][A-Z0-9_]*$") # Cypher relationshi
 with open("config.yaml", 'r') as f:
     CFG = yaml.safe_load(f)
 
+# Allow-lists at least this large are parsed straight from a read-only mmap
+# instead of first being copied into a bytes buffer (with orjson; the stdlib
+# fallback copies)
+ALLOW_LIST_MMAP_MIN_BYTES = 1 << 20
+
+# Parsed allow-lists keyed by path:
+#   path -> (st_mtime_ns, st_size, (allow_list, label_set, relationship_set)).
+# A generator is built per request, so only re-parse when the file changes.
+_ALLOW_LIST_CACHE: dict[str, tuple] = {}
+
+def _freeze_allow_list(value):
+    """
+    Recursively intern strings and make containers read-only.
+
+    The cached allow-list is shared by every generator, so dicts become
+    read-only mappings and lists become tuples; interning lets names repeated
+    across labels share one object.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k) if isinstance(k, str) else k: _freeze_allow_list(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_allow_list(v) for v in value)
+    return value
+
+def _load_allow_list(path: str) -> tuple:
+    """Return (allow_list, label frozenset, relationship frozenset) for ``path``."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is not None:
+        cached = _ALLOW_LIST_CACHE.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+    with open(path, 'rb') as fh:
+        if st is not None and st.st_size >= ALLOW_LIST_MMAP_MIN_BYTES:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                allow_list = json_loads(view)
+        else:
+            allow_list = json_loads(fh.read())
+    # Done once per file version; the result is cached below
+    allow_list = _freeze_allow_list(allow_list)
+    # Hash sets for O(1) membership checks during validation
+    entry = (
+        allow_list,
+        frozenset(allow_list.get("node_labels", [])),
+        frozenset(allow_list.get("relationship_types", [])),
+    )
+    if st is not None:
+        _ALLOW_LIST_CACHE[path] = (st.st_mtime_ns, st.st_size, entry)
+    return entry
+
+def allow_list_signature(path: str | None = None) -> tuple | None:
+    """Identify the allow-list version on disk: (path, st_mtime_ns, st_size), or None if missing."""
+    path = path or CFG.get('schema', {}).get('allow_list_path', 'allow_list.json')
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
 class CypherGenerator:
     def __init__(self, allow_list_path: str = None):
         path = allow_list_path or CFG['schema']['allow_list_path']
         try:
-            with open(path, 'r') as fh:
-                self.allow_list = json.load(fh)
+            # The cache already holds the lookup sets for this file version
+            self._allow_list, self._label_set, self._relationship_set = _load_allow_list(path)
         except FileNotFoundError:
             logger.error("allow_list.json not found; create it with schema_catalog.generate_schema_allow_list()")
             self.allow_list = {"node_labels": [], "relationship_types": [], "properties": {}}
 
+    @property
+    def allow_list(self):
+        """
+        Read-only view of the allow-list, not a dict: mappings are
+        MappingProxyType and lists are tuples, whether loaded from disk, the
+        empty fallback, or assigned. Copy into dicts/lists before mutating or
+        passing to json.dumps.
+        """
+        return self._allow_list
+
+    @allow_list.setter
+    def allow_list(self, allow_list):
+        # Freeze like a loaded allow-list, and keep the validators' lookup sets
+        # in step with the replacement
+        allow_list = _freeze_allow_list(allow_list)
+        self._allow_list = allow_list
+        self._label_set = frozenset(allow_list.get("node_labels", []))
+        self._relationship_set = frozenset(allow_list.get("relationship_types", []))
+
     def _validate_label(self, label: str) -> bool:
-        if not label or not LABEL_REGEX.match(label):
-            return False
-        return label in self.allow_list.get("node_labels", [])
+        # Set lookup first: it rejects most unknown labels before the regex runs
+        return bool(label) and label in self._label_set and LABEL_REGEX.match(label) is not None
 
     def _validate_relationship_type(self, rel_type: str) -> bool:
-        if not rel_type or not RELATIONSHIP_TYPE_REGEX.match(rel_type):
-            return False
-        return rel_type in self.allow_list.get("relationship_types", [])
+        return bool(rel_type) and rel_type in self._relationship_set and RELATIONSHIP_TYPE_REGEX.match(rel_type) is not None
 
     def validate_label(self, label: str) -> str:
         if self._validate_label(label):
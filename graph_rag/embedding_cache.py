@@ -0,0 +1,100 @@
+# graph_rag/embedding_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+from graph_rag.observability import get_logger
+from graph_rag.utils import json_dumps, json_loads
+
+logger = get_logger(__name__)
+
+EMBEDDING_CACHE_CAPACITY = 500
+EMBEDDING_CACHE_TTL_SECONDS = 7 * 24 * 3600
+EMBEDDING_CACHE_REDIS_PREFIX = "graphrag:emb:"
+
+def _cache_key(model: str | None, text: str) -> bytes:
+    # Model is part of the key so switching models never serves stale vectors
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+class CachedEmbeddingProvider:
+    """
+    Wraps an embedding provider with an in-process LRU (L1) and an optional
+    Redis cache (L2), both keyed by sha256(model, text).
+
+    Only cache misses are sent to the wrapped provider, in one batched call.
+    Failed embeddings (empty vectors) are never cached, and Redis errors
+    degrade to an L1-only cache rather than failing the request.
+    """
+
+    def __init__(self, provider, capacity: int = EMBEDDING_CACHE_CAPACITY, redis_client=None, ttl_seconds: int = EMBEDDING_CACHE_TTL_SECONDS):
+        self.provider = provider
+        self.model = getattr(provider, 'model', None)
+        self.capacity = capacity
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self._lru: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        keys = [_cache_key(self.model, t) for t in texts]
+        results: list = [None] * len(texts)
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._lru.get(key)
+                if vector is None:
+                    missing.append(i)
+                else:
+                    self._lru.move_to_end(key)
+                    results[i] = vector
+
+        if missing and self.redis_client is not None:
+            missing = self._fill_from_redis(keys, missing, results)
+
+        if missing:
+            fetched = self.provider.get_embeddings([texts[i] for i in missing])
+            fresh = []
+            for i, vector in zip(missing, fetched):
+                results[i] = vector
+                if vector:
+                    fresh.append((keys[i], vector))
+            self._store(fresh)
+            if self.redis_client is not None and fresh:
+                self._write_to_redis(fresh)
+        return results
+
+    def _store(self, items) -> None:
+        with self._lock:
+            for key, vector in items:
+                self._lru[key] = vector
+                self._lru.move_to_end(key)
+            while len(self._lru) > self.capacity:
+                self._lru.popitem(last=False)
+
+    def _fill_from_redis(self, keys, missing, results) -> list[int]:
+        """Fill ``results`` from Redis for the ``missing`` indices; return what is still missing."""
+        try:
+            raw = self.redis_client.mget([EMBEDDING_CACHE_REDIS_PREFIX + keys[i].hex() for i in missing])
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup in Redis failed: {e}")
+            return missing
+        still_missing = []
+        hits = []
+        for i, value in zip(missing, raw):
+            if value is None:
+                still_missing.append(i)
+            else:
+                results[i] = json_loads(value)
+                hits.append((keys[i], results[i]))
+        self._store(hits)
+        return still_missing
+
+    def _write_to_redis(self, items) -> None:
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, vector in items:
+                pipe.set(EMBEDDING_CACHE_REDIS_PREFIX + key.hex(), json_dumps(vector), ex=self.ttl_seconds)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write to Redis failed: {e}")
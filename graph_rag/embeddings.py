@@ -1,7 +1,9 @@
 # graph_rag/embeddings.py
 import os
+import redis
 from dotenv import load_dotenv
 from graph_rag.observability import get_logger, llm_calls_total
+from graph_rag.embedding_cache import CachedEmbeddingProvider
 
 logger = get_logger(__name__)
 # load_dotenv() # Moved to be called explicitly if needed, or mocked
@@ -16,6 +18,16 @@ except Exception:
     # placeholder: real environment should have langchain-openai package
     OpenAIEmbeddings = None
 
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    return default if value is None else value.strip().lower() in _TRUTHY
+
+# Opt-in two-tier embedding cache: in-process LRU, plus Redis when REDIS_URL is set
+ENABLE_EMBEDDING_CACHE = _env_bool("ENABLE_EMBEDDING_CACHE")
+EMBEDDING_CACHE_REDIS_URL = os.getenv("REDIS_URL")
+
 _embedding_provider_instance = None
 
 class EmbeddingProvider:
@@ -44,7 +56,15 @@ class EmbeddingProvider:
 def get_embedding_provider():
     global _embedding_provider_instance
     if _embedding_provider_instance is None:
-        _embedding_provider_instance = EmbeddingProvider()
+        provider = EmbeddingProvider()
+        if ENABLE_EMBEDDING_CACHE:
+            provider = CachedEmbeddingProvider(provider, redis_client=_embedding_cache_redis_client())
+        _embedding_provider_instance = provider
     return _embedding_provider_instance
 
+def _embedding_cache_redis_client():
+    if not EMBEDDING_CACHE_REDIS_URL:
+        return None
+    return redis.from_url(EMBEDDING_CACHE_REDIS_URL)
+
 # embedding_provider = EmbeddingProvider() # Removed module-level instantiation
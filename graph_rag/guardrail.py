@@ -1,4 +1,9 @@
 # graph_rag/guardrail.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from pydantic import BaseModel
 from graph_rag.llm_client import call_llm_structured, LLMStructuredError
 from graph_rag.sanitizer import sanitize_text
@@ -6,6 +11,20 @@ from graph_rag.observability import get_logger
 
 logger = get_logger(__name__)
 
+# Recent verdicts: blake2b(sanitized question) -> (expires_at, allowed). The TTL
+# lets classifier or policy changes take effect within minutes.
+GUARDRAIL_CACHE_SIZE = 4096
+GUARDRAIL_CACHE_TTL_S = 300
+_guardrail_cache: OrderedDict[bytes, tuple[float, bool]] = OrderedDict()
+# Checks currently running, so identical concurrent questions wait on one LLM call
+_guardrail_in_flight: dict[bytes, Future] = {}
+_guardrail_lock = threading.Lock()
+
+def clear_guardrail_cache() -> None:
+    """Drop cached guardrail verdicts, e.g. after the classifier prompt or policy changes."""
+    with _guardrail_lock:
+        _guardrail_cache.clear()
+
 class GuardrailResponse(BaseModel):
     allowed: bool
     reason: str
@@ -14,6 +33,10 @@ def guardrail_check(question: str) -> bool:
     """
     Performs an LLM-based guardrail check to detect prompt injection or illegal requests.
     
+    Verdicts are cached for GUARDRAIL_CACHE_TTL_S, keyed by a hash of the
+    sanitized question, and concurrent checks of the same question share a
+    single LLM call.
+    
     Args:
         question: The user question to analyze (should already be sanitized)
         
@@ -22,7 +45,42 @@ def guardrail_check(question: str) -> bool:
     """
     # Ensure the input is sanitized before sending to LLM
     sanitized_question = sanitize_text(question)
+    # Hash rather than store the question text itself
+    key = hashlib.blake2b(sanitized_question.encode('utf-8'), digest_size=16).digest()
     
+    with _guardrail_lock:
+        cached = _guardrail_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _guardrail_cache.move_to_end(key)
+            return cached[1]
+        in_flight = _guardrail_in_flight.get(key)
+        if in_flight is None:
+            in_flight = _guardrail_in_flight[key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return in_flight.result()
+    
+    allowed = False
+    try:
+        verdict = _classify_question(sanitized_question)
+        allowed = bool(verdict)
+        # Failed classifications block this request but are not remembered
+        if verdict is not None:
+            with _guardrail_lock:
+                _guardrail_cache[key] = (time.monotonic() + GUARDRAIL_CACHE_TTL_S, allowed)
+                _guardrail_cache.move_to_end(key)
+                while len(_guardrail_cache) > GUARDRAIL_CACHE_SIZE:
+                    _guardrail_cache.popitem(last=False)
+        return allowed
+    finally:
+        with _guardrail_lock:
+            _guardrail_in_flight.pop(key, None)
+        in_flight.set_result(allowed)
+
+def _classify_question(sanitized_question: str) -> bool | None:
+    """Ask the LLM classifier; returns None when classification fails."""
     # Construct a short classification prompt
     prompt = f"""You are a security classifier. Analyze the following user question and determine if it should be allowed or blocked.
 
@@ -57,8 +115,8 @@ Respond with your classification:"""
         # If LLM classification fails, err on the side of caution and block
         logger.error(f"Guardrail LLM classification failed: {e}")
         logger.warning(f"Blocking question due to classification failure: {sanitized_question[:50]}...")
-        return False
+        return None
     except Exception as e:
         # Any other error - block for safety
         logger.error(f"Unexpected error in guardrail check: {e}")
-        return False
+        return None
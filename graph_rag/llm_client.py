@@ -5,7 +5,8 @@ import json
 import yaml
 import redis
 from pydantic import BaseModel, ValidationError
-from graph_rag.observability import get_logger, tracer, llm_calls_total
+from opentelemetry.trace import get_current_span
+from graph_rag.observability import get_logger, llm_calls_total
 from graph_rag.audit_store import audit_store
 
 logger = get_logger(__name__)
@@ -62,6 +63,11 @@ def consume_token(key=RATE_LIMIT_KEY, tokens=1) -> bool:
     result = redis_client.eval(RATE_LIMIT_LUA_SCRIPT, 1, key, tokens, RATE_LIMIT_PER_MINUTE, now)
     return result == 1
 
+def _current_trace_id() -> str | None:
+    """Hex trace id of the active span (same format as RAGChain responses), or None."""
+    context = get_current_span().get_span_context()
+    return f"{context.trace_id:x}" if context.is_valid else None
+
 class LLMStructuredError(Exception):
     pass
 
@@ -87,24 +93,36 @@ def call_llm_structured(prompt: str, schema_model: BaseModel, model: str = None,
     max_tokens = max_tokens or CFG['llm']['max_tokens']
     response = call_llm_raw(prompt, model=model, max_tokens=max_tokens)
 
-    # Try to parse JSON safely
+    # Fast path: let pydantic-core parse and validate the raw JSON in one pass,
+    # without building an intermediate dict
+    try:
+        return schema_model.model_validate_json(response)
+    except ValidationError as e:
+        if not _is_json_parse_error(e):
+            _record_validation_failure(prompt, response, e)
+            raise LLMStructuredError("Structured output failed validation") from e
+
+    # Not clean JSON: attempt to extract a JSON substring
     try:
-        parsed = json.loads(response)
-    except Exception:
-        # attempt to extract JSON substring
-        try:
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            parsed = json.loads(response[start:end])
-        except Exception as e:
-            logger.error(f"LLM returned non-JSON and extraction failed: {response}")
-            audit_store.record(entry={"type":"llm_parse_failure", "prompt": prompt, "response":response, "error":str(e), "trace_id": str(tracer.get_current_span().context.trace_id) if tracer.get_current_span() else None})
-            raise LLMStructuredError("Invalid JSON from LLM") from e
+        start = response.find("{")
+        end = response.rfind("}") + 1
+        parsed = json.loads(response[start:end])
+    except Exception as e:
+        logger.error(f"LLM returned non-JSON and extraction failed: {response}")
+        audit_store.record(entry={"type":"llm_parse_failure", "prompt": prompt, "response":response, "error":str(e), "trace_id": _current_trace_id()})
+        raise LLMStructuredError("Invalid JSON from LLM") from e
 
     try:
         validated = schema_model.model_validate(parsed) # Use model_validate for Pydantic v2+
         return validated
     except ValidationError as e:
-        logger.warning(f"LLM output failed validation: {e}")
-        audit_store.record(entry={"type":"llm_validation_failed", "prompt": prompt, "response":response, "error":str(e), "trace_id": str(tracer.get_current_span().context.trace_id) if tracer.get_current_span() else None})
+        _record_validation_failure(prompt, response, e)
         raise LLMStructuredError("Structured output failed validation") from e
+
+def _is_json_parse_error(error: ValidationError) -> bool:
+    """True when model_validate_json failed on the JSON itself rather than the schema."""
+    return any(err.get("type") == "json_invalid" for err in error.errors())
+
+def _record_validation_failure(prompt: str, response: str, error: ValidationError) -> None:
+    logger.warning(f"LLM output failed validation: {error}")
+    audit_store.record(entry={"type":"llm_validation_failed", "prompt": prompt, "response":response, "error":str(error), "trace_id": _current_trace_id()})
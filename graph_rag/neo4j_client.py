@@ -1,8 +1,9 @@
 # graph_rag/neo4j_client.py
 import os
 import yaml
+from contextlib import contextmanager
 from time import perf_counter
-from neo4j import GraphDatabase, exceptions
+from neo4j import GraphDatabase, exceptions, unit_of_work
 from dotenv import load_dotenv
 from graph_rag.observability import get_logger, tracer, db_query_total, db_query_failed, db_query_latency, inflight_queries
 
@@ -95,3 +96,58 @@ class Neo4jClient:
     def execute_write_query(self, query: str, params: dict | None = None, timeout: float | None = None, query_name: str | None = None):
         # write only used by ingestion/admin flows
         return self._execute_query(query, params=params, access_mode="WRITE", timeout=timeout, query_name=query_name)
+
+    @contextmanager
+    def session(self, access_mode: str = "WRITE"):
+        """Open a driver session so several units of work can share one connection."""
+        with self._driver.session(default_access_mode=access_mode) as session:
+            yield session
+
+    def execute_write_batches(self, query: str, params_list: list[dict], timeout: float | None = None, query_name: str | None = None) -> list[list[dict] | None]:
+        """
+        Run a write query once per params dict within a single session.
+        
+        Each batch is its own managed write transaction (retried by the driver
+        on transient errors), but all batches reuse one session and connection
+        instead of opening a new session per call.
+        
+        Args:
+            query: Cypher write query
+            params_list: One params dict per batch
+            timeout: Per-transaction timeout in seconds
+            query_name: Summary name for tracing and logs
+            
+        Returns:
+            One list of record dicts per params dict; a failed batch yields None
+            so callers can tell it apart from a batch that returned no rows
+        """
+        query_name = query_name or "generic_query"
+        
+        @unit_of_work(timeout=timeout)
+        def _run(tx, batch_params):
+            return [r.data() for r in tx.run(query, batch_params)]
+        
+        results = []
+        with tracer.start_as_current_span("neo4j.query_batches") as span:
+            span.set_attribute("db.system", "neo4j")
+            span.set_attribute("db.statement", query)
+            span.set_attribute("db.statement.summary", query_name)
+            span.set_attribute("db.batch_count", len(params_list))
+            
+            with self.session(access_mode="WRITE") as session:
+                for batch_params in params_list:
+                    inflight_queries.inc()
+                    start = perf_counter()
+                    try:
+                        records = session.execute_write(_run, batch_params)
+                        db_query_latency.observe(perf_counter() - start)
+                        db_query_total.labels(status="success").inc()
+                    except Exception as e:
+                        db_query_total.labels(status="failure").inc()
+                        db_query_failed.inc()
+                        logger.error(f"Batch write failed for query '{query_name}': {e}")
+                        records = None
+                    finally:
+                        inflight_queries.dec()
+                    results.append(records)
+        return results
@@ -45,6 +45,8 @@ def start_metrics_server():
 def get_logger(name: str):
     structlog.configure(
         processors=[
+            # Drop calls below the stdlib level before any rendering work
+            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
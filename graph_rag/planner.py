@@ -1,9 +1,14 @@
 # graph_rag/planner.py
+import logging
+import os
+import threading
+import time
 import yaml
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from graph_rag.observability import get_logger, tracer
 from graph_rag.llm_client import call_llm_structured, LLMStructuredError
-from graph_rag.cypher_generator import CypherGenerator
+from graph_rag.cypher_generator import CypherGenerator, CYPHER_TEMPLATES, allow_list_signature
 from graph_rag.neo4j_client import Neo4jClient
 from graph_rag.embeddings import get_embedding_provider
 
@@ -11,6 +16,76 @@ logger = get_logger(__name__)
 with open("config.yaml", 'r') as f:
     CFG = yaml.safe_load(f)
 
+_neo4j_client_instance = None
+
+def _get_neo4j_client():
+    # One driver (and connection pool) per process rather than per semantic lookup
+    global _neo4j_client_instance
+    if _neo4j_client_instance is None:
+        _neo4j_client_instance = Neo4jClient()
+    return _neo4j_client_instance
+
+def close_neo4j_client() -> None:
+    """Close the shared Neo4j client; the next semantic lookup opens a new one."""
+    global _neo4j_client_instance
+    client, _neo4j_client_instance = _neo4j_client_instance, None
+    if client is not None:
+        client.close()
+
+# Index name is bound as a parameter so the query text is constant and Neo4j
+# reuses one cached plan whatever index is configured
+SEMANTIC_SCHEMA_LOOKUP_QUERY = """
+CALL db.index.vector.queryNodes($index, $top_k, $embedding)
+YIELD node, score
+RETURN node.id as id, node.term as term, node.type as type,
+       node.canonical_id as canonical_id, score
+ORDER BY score DESC
+"""
+
+# Bounded FIFO memo of semantic mappings. Keyed by candidate plus everything
+# that shapes the answer (index, top_k, allow-list and synonyms file versions);
+# only successful label mappings are stored, so new schema embeddings can turn
+# a miss into a hit. Schema terms re-upserted by another process don't touch
+# those files, so entries also expire after SEMANTIC_MAPPING_CACHE_TTL_S.
+SEMANTIC_MAPPING_CACHE_SIZE = 1024
+SEMANTIC_MAPPING_CACHE_TTL_S = 300
+# key -> (expires_at on the monotonic clock, mapped label)
+_semantic_mapping_cache: dict[tuple, tuple[float, str]] = {}
+# Plans are generated on the RAG thread pool
+_semantic_mapping_lock = threading.Lock()
+
+def clear_semantic_mapping_cache() -> None:
+    """Drop memoized semantic mappings, e.g. after schema embeddings are upserted."""
+    with _semantic_mapping_lock:
+        _semantic_mapping_cache.clear()
+
+def _file_signature(path: str | None) -> tuple | None:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+def _cached_semantic_mapping(key: tuple) -> str | None:
+    with _semantic_mapping_lock:
+        cached = _semantic_mapping_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+def _remember_semantic_mapping(key: tuple, mapped: str) -> str:
+    expires_at = time.monotonic() + SEMANTIC_MAPPING_CACHE_TTL_S
+    with _semantic_mapping_lock:
+        # Re-insert so a refreshed entry moves to the end of the eviction order
+        _semantic_mapping_cache.pop(key, None)
+        if len(_semantic_mapping_cache) >= SEMANTIC_MAPPING_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _semantic_mapping_cache[next(iter(_semantic_mapping_cache))]
+        _semantic_mapping_cache[key] = (expires_at, mapped)
+    return mapped
+
 class ExtractedEntities(BaseModel):
     names: list[str] = Field(...)
 
@@ -26,13 +101,10 @@ class QueryPlan(BaseModel):
     question: str
     chain: list[dict] | None = None  # Optional chain of {"intent": name, "params": {...}}
 
+@lru_cache(maxsize=1)
 def _build_template_summary() -> str:
     """Build a summary of available Cypher templates for the LLM to choose from."""
-    cypher_gen = CypherGenerator()
-    
-    # Import CYPHER_TEMPLATES from the module
-    from graph_rag.cypher_generator import CYPHER_TEMPLATES
-    
+    # CYPHER_TEMPLATES is static, so the summary is built once per process
     template_descriptions = []
     for template_name, template_info in CYPHER_TEMPLATES.items():
         schema_reqs = template_info.get("schema_requirements", {})
@@ -66,8 +138,6 @@ def _validate_and_build_chain(chain_template_names: list[str], base_params: dict
     Returns:
         List of dicts with {"intent": name, "params": {...}} for each valid template
     """
-    from graph_rag.cypher_generator import CYPHER_TEMPLATES
-    
     validated_chain = []
     
     for i, template_name in enumerate(chain_template_names):
@@ -92,7 +162,8 @@ def _validate_and_build_chain(chain_template_names: list[str], base_params: dict
             "params": step_params
         })
         
-        logger.debug(f"Chain step {i}: {template_name} with params {step_params}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Chain step {i}: {template_name} with params {step_params}")
     
     return validated_chain
 
@@ -111,16 +182,25 @@ def _find_best_anchor_entity_semantic(candidate: str) -> str | None:
     
     candidate = candidate.strip()
     
+    # Get configuration
+    schema_embeddings_config = CFG.get('schema_embeddings', {})
+    index_name = schema_embeddings_config.get('index_name', 'schema_embeddings')
+    top_k = schema_embeddings_config.get('top_k', 5)
+    timeout = CFG.get('guardrails', {}).get('neo4j_timeout', 10)
+    
+    cache_key = (
+        candidate, index_name, top_k,
+        allow_list_signature(),
+        _file_signature(schema_embeddings_config.get('include_synonyms_path'))
+    )
+    cached = _cached_semantic_mapping(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         with tracer.start_as_current_span("planner.semantic_mapping") as span:
             span.set_attribute("candidate_entity", candidate)
             
-            # Get configuration
-            schema_embeddings_config = CFG.get('schema_embeddings', {})
-            index_name = schema_embeddings_config.get('index_name', 'schema_embeddings')
-            top_k = schema_embeddings_config.get('top_k', 5)
-            timeout = CFG.get('guardrails', {}).get('neo4j_timeout', 10)
-            
             # Compute embedding for candidate
             embedding_provider = get_embedding_provider()
             embeddings = embedding_provider.get_embeddings([candidate])
@@ -133,29 +213,23 @@ def _find_best_anchor_entity_semantic(candidate: str) -> str | None:
             span.set_attribute("embedding_dimensions", len(candidate_embedding))
             
             # Query vector index for nearest schema terms
-            neo4j_client = Neo4jClient()
-            
-            vector_query = f"""
-            CALL db.index.vector.queryNodes('{index_name}', $top_k, $embedding) 
-            YIELD node, score 
-            RETURN node.id as id, node.term as term, node.type as type, 
-                   node.canonical_id as canonical_id, score
-            ORDER BY score DESC
-            """
+            neo4j_client = _get_neo4j_client()
             
             params = {
+                'index': index_name,
                 'top_k': top_k,
                 'embedding': candidate_embedding
             }
             
             results = neo4j_client.execute_read_query(
-                vector_query, 
+                SEMANTIC_SCHEMA_LOOKUP_QUERY, 
                 params, 
                 timeout=timeout,
                 query_name="semantic_schema_lookup"
             )
             
             if not results:
+                # execute_read_query also returns [] on query errors, so don't cache this
                 logger.info(f"No schema embeddings found for candidate '{candidate}'")
                 return None
             
@@ -184,8 +258,8 @@ def _find_best_anchor_entity_semantic(candidate: str) -> str | None:
                         logger.info(f"Semantic mapping: '{candidate}' -> '{canonical_id}' (score: {score:.3f})")
                         span.set_attribute("mapped_entity", canonical_id)
                         span.set_attribute("similarity_score", score)
-                        return canonical_id
-                    else:
+                        return _remember_semantic_mapping(cache_key, canonical_id)
+                    elif logger.isEnabledFor(logging.DEBUG):
                         logger.debug(f"Schema term '{canonical_id}' not in allow_list, skipping")
                 
                 # For relationship or property types, we might map them differently in the future
@@ -248,7 +322,6 @@ Respond with your classification:"""
         )
         
         # Validate the returned intent is in available templates
-        from graph_rag.cypher_generator import CYPHER_TEMPLATES
         if planner_output.intent not in CYPHER_TEMPLATES:
             logger.warning(f"LLM returned invalid intent '{planner_output.intent}'. Falling back to 'general_rag_query'.")
             planner_output.intent = "general_rag_query"
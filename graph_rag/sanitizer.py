@@ -44,6 +44,20 @@ CYPHER_KEYWORDS = {
     'DETACH DELETE', 'DROP', 'CREATE INDEX', 'CREATE CONSTRAINT'
 }
 
+# Single-pass keyword scan: a zero-width lookahead tries every keyword at each
+# position (longest first, one group per keyword), and each hit also counts the
+# keywords it starts with (e.g. 'CREATE INDEX' implies 'CREATE'), so the result
+# matches a per-keyword substring search.
+_CYPHER_KEYWORDS_ORDERED = sorted(CYPHER_KEYWORDS, key=len, reverse=True)
+_CYPHER_KEYWORD_RE = re.compile(
+    '(?=' + '|'.join(f'({re.escape(k)})' for k in _CYPHER_KEYWORDS_ORDERED) + ')',
+    re.IGNORECASE
+)
+_CYPHER_KEYWORD_PREFIXES = [
+    frozenset(k for k in CYPHER_KEYWORDS if keyword.startswith(k))
+    for keyword in _CYPHER_KEYWORDS_ORDERED
+]
+
 # Shell/system command patterns
 SHELL_PATTERNS = [
     r'\b(rm|del|format|fdisk|mkfs)\b',
@@ -66,6 +80,24 @@ SQL_PATTERNS = [
     r"DELETE\s+FROM",
 ]
 
+# Suspicious character sequences
+SUSPICIOUS_PATTERNS = [
+    r'[;\'"]\s*[;\'"]\s*[;\'"]',  # Multiple quotes/semicolons
+    r'\b\d+\s*=\s*\d+\b',        # Numeric equality (SQL injection)
+    r'<\s*script',                # Script tags
+    r'javascript\s*:',            # JavaScript protocol
+    r'\beval\s*\(',               # eval function
+    r'\bsetTimeout\s*\(',         # setTimeout function
+    r'\bsetInterval\s*\(',        # setInterval function
+]
+
+# Every pattern above only ever flags the text, so they are folded into one
+# precompiled alternation and the input is scanned once instead of per pattern
+_MALICIOUS_PATTERN_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in SHELL_PATTERNS + SQL_PATTERNS + SUSPICIOUS_PATTERNS),
+    re.IGNORECASE
+)
+
 def sanitize_text(text: str) -> str:
     """
     Sanitizes input text by removing suspicious sequences, control characters,
@@ -84,6 +116,11 @@ def sanitize_text(text: str) -> str:
     if len(text) > MAX_TEXT_LENGTH:
         text = text[:MAX_TEXT_LENGTH]
     
+    # Fast path: printable ASCII has no control characters, so when it also
+    # contains no suspicious sequence only whitespace normalization applies
+    if text.isascii() and text.isprintable() and not any(seq in text for seq in SUSPICIOUS_SEQUENCES):
+        return ' '.join(text.split())
+    
     # Remove control characters (Unicode category Cc)
     text = ''.join(char for char in text if unicodedata.category(char) != 'Cc')
     
@@ -91,13 +128,9 @@ def sanitize_text(text: str) -> str:
     for sequence in SUSPICIOUS_SEQUENCES:
         text = text.replace(sequence, ' ')
     
-    # Normalize whitespace - collapse multiple whitespace chars to single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    
-    return text
+    # Normalize whitespace - split() drops leading/trailing runs and join
+    # collapses the rest to single spaces, without going through the regex engine
+    return ' '.join(text.split())
 
 def is_probably_malicious(text: str) -> bool:
     """
@@ -112,43 +145,21 @@ def is_probably_malicious(text: str) -> bool:
     if not isinstance(text, str):
         return False
     
-    text_upper = text.upper()
-    
-    # Count Cypher keywords
-    cypher_keyword_count = sum(1 for keyword in CYPHER_KEYWORDS if keyword in text_upper)
-    
-    # Check for multiple Cypher keywords (likely injection attempt)
-    if cypher_keyword_count >= 3:
-        return True
-    
-    # Check for shell command patterns
-    for pattern in SHELL_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
+    # Count distinct Cypher keywords, stopping as soon as the threshold is hit
+    found_keywords = set()
+    for match in _CYPHER_KEYWORD_RE.finditer(text):
+        found_keywords.update(_CYPHER_KEYWORD_PREFIXES[match.lastindex - 1])
+        # Check for multiple Cypher keywords (likely injection attempt)
+        if len(found_keywords) >= 3:
             return True
     
-    # Check for SQL injection patterns
-    for pattern in SQL_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
+    # Check for shell command, SQL injection and suspicious sequence patterns
+    if _MALICIOUS_PATTERN_RE.search(text):
+        return True
     
     # Check for excessive special characters (potential obfuscation)
     special_char_count = sum(1 for char in text if char in ';(){}[]<>|&$`"\'\\')
     if len(text) > 0 and (special_char_count / len(text)) > 0.3:
         return True
     
-    # Check for suspicious character sequences
-    suspicious_patterns = [
-        r'[;\'"]\s*[;\'"]\s*[;\'"]',  # Multiple quotes/semicolons
-        r'\b\d+\s*=\s*\d+\b',        # Numeric equality (SQL injection)
-        r'<\s*script',                # Script tags
-        r'javascript\s*:',            # JavaScript protocol
-        r'\beval\s*\(',               # eval function
-        r'\bsetTimeout\s*\(',         # setTimeout function
-        r'\bsetInterval\s*\(',        # setInterval function
-    ]
-    
-    for pattern in suspicious_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    
     return False
@@ -1,11 +1,63 @@
 # graph_rag/schema_catalog.py
-import json
+import os
+import tempfile
 import yaml
 from graph_rag.neo4j_client import Neo4jClient
 from graph_rag.observability import get_logger
+from graph_rag.utils import json_dumps
 
 logger = get_logger(__name__)
 
+# Labels, relationship types and the schema node list in a single round-trip
+SCHEMA_INTROSPECTION_QUERY = """
+CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+CALL { CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) AS rels }
+CALL { CALL db.schema.visualization() YIELD nodes RETURN nodes AS schema_nodes }
+RETURN labels, rels, schema_nodes
+"""
+
+# Property keys for every requested label in one round-trip, read from the
+# schema procedure rather than by scanning every node in the graph
+LABEL_PROPERTIES_QUERY = """
+CALL db.schema.nodeTypeProperties() YIELD nodeLabels, propertyName
+WITH nodeLabels, propertyName WHERE propertyName IS NOT NULL
+UNWIND nodeLabels AS label
+WITH label, propertyName WHERE label IN $labels
+RETURN label, collect(DISTINCT propertyName) AS keys
+"""
+
+# fdatasync skips the metadata flush fsync does; not available on every platform
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    """Write JSON via a temp file and rename, so readers never see a partial file."""
+    payload = json_dumps(data, indent=True)
+    # Unique temp file next to the target so concurrent writers don't collide
+    # and the rename stays on one filesystem
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+    try:
+        try:
+            # mkstemp creates 0600; keep the allow-list readable like before
+            os.fchmod(fd, 0o644)
+            # Single unbuffered write of the serialized payload, then a data-only sync
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            _fdatasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def generate_schema_allow_list(output_path: str = None):
     with open("config.yaml", 'r') as f:
         cfg = yaml.safe_load(f)
@@ -13,18 +65,19 @@ def generate_schema_allow_list(output_path: str = None):
 
     try:
         client = Neo4jClient()
-        labels = [r['label'] for r in client.execute_read_query("CALL db.labels() YIELD label RETURN label")]
-        rels = [r['relationshipType'] for r in client.execute_read_query("CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType")]
-        schema_result = client.execute_read_query("CALL db.schema.visualization()")
-        nodes = schema_result[0].get('nodes', []) if schema_result else []
-        properties = {}
-        for node in nodes:
-            name = node.get('name')
-            prop_rows = client.execute_read_query(f"MATCH (n:`{name}`) UNWIND keys(n) AS key RETURN DISTINCT key")
-            properties[name] = [p['key'] for p in prop_rows]
+        schema_result = client.execute_read_query(SCHEMA_INTROSPECTION_QUERY, query_name="schema_introspection")
+        row = schema_result[0] if schema_result else {}
+        labels = row.get('labels', [])
+        rels = row.get('rels', [])
+        nodes = row.get('schema_nodes') or []
+        names = [node.get('name') for node in nodes]
+        properties = {name: [] for name in names}
+        if names:
+            prop_rows = client.execute_read_query(LABEL_PROPERTIES_QUERY, {"labels": names}, query_name="schema_label_properties")
+            for row in prop_rows:
+                properties[row['label']] = row['keys']
         allow = {"node_labels": labels, "relationship_types": rels, "properties": properties}
-        with open(output_path, 'w') as fh:
-            json.dump(allow, fh, indent=2)
+        _write_json_atomic(output_path, allow)
         logger.info(f"Allow-list written to {output_path}")
         return allow
     except Exception as e:
@@ -35,7 +88,6 @@ def generate_schema_allow_list(output_path: str = None):
             "relationship_types": ["PART_OF","HAS_CHUNK","MENTIONS","FOUNDED","HAS_PRODUCT"],
             "properties": {}
         }
-        with open(output_path, 'w') as fh:
-            json.dump(stub_allow_list, fh, indent=2)
+        _write_json_atomic(output_path, stub_allow_list)
         logger.info(f"Stub allow-list written to {output_path}")
         return stub_allow_list
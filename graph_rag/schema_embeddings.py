@@ -1,14 +1,98 @@
 # graph_rag/schema_embeddings.py
-import json
+import hashlib
 import os
+import sqlite3
+import sys
+import time
+import numpy as np
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from graph_rag.observability import get_logger
+from graph_rag.utils import json_loads
 from graph_rag.embeddings import get_embedding_provider
+from graph_rag.embedding_cache import CachedEmbeddingProvider
 from graph_rag.neo4j_client import Neo4jClient
 
 logger = get_logger(__name__)
 
+# Embedding provider request sizing and retry policy
+DEFAULT_EMBEDDING_BATCH_SIZE = 96
+DEFAULT_EMBEDDING_MAX_WORKERS = 8
+DEFAULT_EMBEDDING_MAX_RETRIES = 2
+EMBEDDING_RETRY_BACKOFF_SECONDS = 0.5
+
+# Shared term type strings; every term dict references these same objects
+_TYPE_LABEL = sys.intern('label')
+_TYPE_REL = sys.intern('relationship')
+_TYPE_PROP = sys.intern('property')
+
+# Keys every term must carry; 'embedding' is attached by generate_schema_embeddings
+REQUIRED_TERM_KEYS = ('id', 'term', 'type')
+
+# Max host parameters per sqlite IN (...) probe (SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds)
+EMBEDDING_CACHE_PROBE_CHUNK = 500
+
+# Upper bound on rows per UNWIND transaction, and concurrent batch writes
+DEFAULT_UPSERT_BATCH_SIZE = 1000
+DEFAULT_UPSERT_CONCURRENCY = 8
+
+# Batched MERGE of SchemaTerm nodes; $rows is a list of term dicts. The
+# embedding (the largest property) is only rewritten when its hash changed.
+SCHEMA_TERM_UPSERT_QUERY = """
+UNWIND $rows AS row
+MERGE (s:SchemaTerm {id: row.id})
+ON CREATE SET s.created_at = datetime()
+SET s.term = row.term,
+    s.type = row.type,
+    s.canonical_id = row.canonical_id,
+    s.updated_at = datetime()
+FOREACH (_ IN CASE WHEN coalesce(s.embedding_hash, '') <> row.embedding_hash THEN [1] ELSE [] END |
+    SET s.embedding = row.embedding,
+        s.embedding_hash = row.embedding_hash
+)
+RETURN s.id as id,
+       CASE WHEN s.created_at = s.updated_at THEN 'created' ELSE 'updated' END as operation
+"""
+
+# In-process memoization, invalidated by file mtime / term list changes:
+#   (allow_list_path, synonyms_path) -> ((allow_list_stat, synonyms_stat), terms)
+#   where each *_stat is (st_mtime_ns, st_size)
+#   (provider_class, provider_model) -> (term_strings, embeddings)
+_SCHEMA_TERMS_CACHE: Dict[tuple, tuple] = {}
+_SCHEMA_EMBEDDINGS_CACHE: Dict[tuple, tuple] = {}
+
+def _clear_planner_mapping_cache() -> None:
+    # Only a loaded planner holds mappings; don't import it just to clear them
+    planner = sys.modules.get('graph_rag.planner')
+    if planner is not None:
+        planner.clear_semantic_mapping_cache()
+
+def clear_schema_embedding_caches() -> None:
+    """Drop memoized schema terms and embeddings, and the planner's semantic mappings."""
+    _SCHEMA_TERMS_CACHE.clear()
+    _SCHEMA_EMBEDDINGS_CACHE.clear()
+    _clear_planner_mapping_cache()
+
+def _file_signature(path: str):
+    # Size catches rewrites that land within the filesystem's mtime granularity
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _provider_cache_key(embedding_provider) -> tuple:
+    # Key on the real provider so toggling the query cache keeps disk cache hits
+    if isinstance(embedding_provider, CachedEmbeddingProvider):
+        embedding_provider = embedding_provider.provider
+    return (type(embedding_provider).__name__, getattr(embedding_provider, 'model', None))
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file from its raw bytes."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
 def collect_schema_terms() -> List[Dict[str, Any]]:
     """
     Extract schema terms from allow_list.json and optionally from schema_synonyms.json.
@@ -20,139 +104,388 @@ def collect_schema_terms() -> List[Dict[str, Any]]:
     with open("config.yaml", 'r') as f:
         cfg = yaml.safe_load(f)
     
-    # Load allow_list.json
     allow_list_path = cfg['schema']['allow_list_path']
+    synonyms_path = cfg.get('schema_embeddings', {}).get('include_synonyms_path')
+    
+    # Reuse the previous result while neither source file has changed on disk
+    cache_key = (allow_list_path, synonyms_path)
+    allow_list_stat = _file_signature(allow_list_path)
+    signature = (allow_list_stat, _file_signature(synonyms_path) if synonyms_path else None)
+    cached = _SCHEMA_TERMS_CACHE.get(cache_key)
+    if allow_list_stat is not None and cached is not None and cached[0] == signature:
+        return [dict(term_data) for term_data in cached[1]]
+    
+    # Load allow_list.json
     try:
-        with open(allow_list_path, 'r') as f:
-            allow_list = json.load(f)
+        allow_list = _load_json_file(allow_list_path)
     except FileNotFoundError:
         logger.error(f"Allow list file not found: {allow_list_path}")
         return []
     
     terms = []
+    canonical_count = 0
+    synonym_count = 0
     
     # Extract node labels
     for label in allow_list.get('node_labels', []):
+        label = sys.intern(label)
         terms.append({
             "id": f"label:{label}",
             "term": label,
-            "type": "label",
+            "type": _TYPE_LABEL,
             "canonical_id": label
         })
+        canonical_count += 1
     
     # Extract relationship types
     for rel_type in allow_list.get('relationship_types', []):
+        rel_type = sys.intern(rel_type)
         terms.append({
             "id": f"relationship:{rel_type}",
             "term": rel_type,
-            "type": "relationship",
+            "type": _TYPE_REL,
             "canonical_id": rel_type
         })
+        canonical_count += 1
     
     # Extract property keys
     properties = allow_list.get('properties', {})
-    unique_properties = set()
-    for node_props in properties.values():
-        unique_properties.update(node_props)
+    unique_properties = set().union(*properties.values())
     
     for prop in unique_properties:
+        prop = sys.intern(prop)
         terms.append({
             "id": f"property:{prop}",
             "term": prop,
-            "type": "property",
+            "type": _TYPE_PROP,
             "canonical_id": prop
         })
+        canonical_count += 1
     
-    # Load synonyms if available
-    synonyms_path = cfg.get('schema_embeddings', {}).get('include_synonyms_path')
-    if synonyms_path and os.path.exists(synonyms_path):
+    # Load synonyms if available (a missing file is not an error)
+    if synonyms_path:
         try:
-            with open(synonyms_path, 'r') as f:
-                synonyms = json.load(f)
+            synonyms = _load_json_file(synonyms_path)
             
-            # Add synonyms for existing terms
-            for term_data in terms[:]:  # Create copy to avoid modifying during iteration
-                canonical_id = term_data['canonical_id']
-                term_type = term_data['type']
-                
-                # Check if this term has synonyms
-                if canonical_id in synonyms.get(term_type, {}):
-                    for synonym in synonyms[term_type][canonical_id]:
+            # Add synonyms for existing terms, skipping any (type, term) already present
+            canonical_ids_by_type = {
+                _TYPE_LABEL: set(allow_list.get('node_labels', [])),
+                _TYPE_REL: set(allow_list.get('relationship_types', [])),
+                _TYPE_PROP: unique_properties
+            }
+            seen = {(term_data['type'], term_data['term']) for term_data in terms}
+            for term_type, canonical_ids in canonical_ids_by_type.items():
+                for canonical_id, term_synonyms in synonyms.get(term_type, {}).items():
+                    if canonical_id not in canonical_ids:
+                        continue
+                    canonical_id = sys.intern(canonical_id)
+                    for synonym in term_synonyms:
+                        if (term_type, synonym) in seen:
+                            continue
+                        seen.add((term_type, synonym))
                         terms.append({
                             "id": f"{term_type}:{synonym}",
                             "term": synonym,
                             "type": term_type,
                             "canonical_id": canonical_id  # Points to the original term
                         })
+                        synonym_count += 1
             
             logger.info(f"Loaded synonyms from {synonyms_path}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to load synonyms from {synonyms_path}: {e}")
     
-    logger.info(f"Collected {len(terms)} schema terms ({len([t for t in terms if t['term'] == t['canonical_id']])} canonical + {len([t for t in terms if t['term'] != t['canonical_id']])} synonyms)")
-    return terms
+    logger.info(f"Collected {len(terms)} schema terms ({canonical_count} canonical + {synonym_count} synonyms)")
+    if allow_list_stat is not None:
+        _SCHEMA_TERMS_CACHE[cache_key] = (signature, terms)
+    # Hand out copies so callers cannot mutate the cached entries
+    return [dict(term_data) for term_data in terms]
 
-def compute_embeddings(terms: List[str]) -> List[List[float]]:
+def _embed_batch_with_retry(embedding_provider, batch: List[str], max_retries: int) -> List[List[float]]:
+    """
+    Embed one batch of terms, retrying with exponential backoff on failure.
+    
+    Providers report failures either by raising or, like EmbeddingProvider,
+    by returning empty vectors; a short result or any empty vector counts as a
+    failed attempt. The last attempt's result is returned for the caller to
+    reject, and its exception is re-raised.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            vectors = embedding_provider.get_embeddings(batch)
+            if len(vectors) == len(batch) and all(len(vector) for vector in vectors):
+                return vectors
+            if attempt == max_retries:
+                return vectors
+            error = f"{len(vectors)} vectors returned, some possibly empty"
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            error = e
+        delay = EMBEDDING_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+        logger.warning(f"Embedding batch of {len(batch)} terms failed (attempt {attempt + 1}): {error}. Retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+def _embedding_cache_key(embedding_provider, term: str) -> str:
+    provider_name, model = _provider_cache_key(embedding_provider)
+    return f"{provider_name}:{model}:{hashlib.sha256(term.encode('utf-8')).hexdigest()}"
+
+def _open_embedding_cache(cache_path: str) -> sqlite3.Connection:
+    """Open (creating if needed) the on-disk embedding cache at ``cache_path``."""
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS emb(key TEXT PRIMARY KEY, vec BLOB)")
+    return conn
+
+def _read_cached_embeddings(conn: sqlite3.Connection, keys: List[str]) -> Dict[str, np.ndarray]:
+    """Fetch cached vectors for ``keys``; keys without an entry are simply absent."""
+    found = {}
+    for i in range(0, len(keys), EMBEDDING_CACHE_PROBE_CHUNK):
+        chunk = keys[i:i + EMBEDDING_CACHE_PROBE_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        for key, blob in conn.execute(f"SELECT key, vec FROM emb WHERE key IN ({placeholders})", chunk):
+            found[key] = np.frombuffer(blob, dtype=np.float32)
+    return found
+
+def _write_cached_embeddings(conn: sqlite3.Connection, items: List[tuple]) -> None:
+    """Store ``(key, vector)`` pairs as float32 blobs."""
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO emb(key, vec) VALUES (?, ?)",
+            [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in items]
+        )
+
+def _embed_terms(embedding_provider, terms: List[str], batch_size: int, max_workers: int, max_retries: int) -> List[List[float]]:
+    """Embed ``terms`` in fixed-size batches, concurrently, preserving input order."""
+    batches = [terms[i:i + batch_size] for i in range(0, len(terms), batch_size)]
+    
+    if len(batches) == 1:
+        embeddings = _embed_batch_with_retry(embedding_provider, batches[0], max_retries)
+    else:
+        # executor.map yields results in submission order
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            batch_results = list(executor.map(
+                lambda batch: _embed_batch_with_retry(embedding_provider, batch, max_retries),
+                batches
+            ))
+        embeddings = [vector for batch_vectors in batch_results for vector in batch_vectors]
+    
+    logger.info(f"Computed embeddings for {len(terms)} terms in {len(batches)} batches")
+    return embeddings
+
+def compute_embeddings(terms: List[str]) -> np.ndarray:
     """
     Compute embeddings for a list of terms using the configured embedding provider.
     
+    Terms are sent in fixed-size batches (``embeddings.batch_size``) which are
+    embedded concurrently and reassembled in input order. When
+    ``embeddings.cache_path`` is set, vectors are first looked up in a local
+    sqlite cache keyed by provider, model and term hash, and only cache misses
+    are sent to the provider.
+    
     Args:
         terms: List of term strings to embed
         
     Returns:
-        List of embedding vectors (one per term)
+        ``float32`` array of shape ``(len(terms), dimensions)``, one row per
+        term, or an empty list if embedding failed
     """
     if not terms:
         return []
     
+    with open("config.yaml", 'r') as f:
+        cfg = yaml.safe_load(f)
+    embeddings_cfg = cfg.get('embeddings', {})
+    batch_size = embeddings_cfg.get('batch_size', DEFAULT_EMBEDDING_BATCH_SIZE)
+    max_workers = embeddings_cfg.get('max_workers', DEFAULT_EMBEDDING_MAX_WORKERS)
+    max_retries = embeddings_cfg.get('max_retries', DEFAULT_EMBEDDING_MAX_RETRIES)
+    cache_path = embeddings_cfg.get('cache_path')
+    
+    cache_conn = None
     try:
         embedding_provider = get_embedding_provider()
-        embeddings = embedding_provider.get_embeddings(terms)
-        logger.info(f"Computed embeddings for {len(terms)} terms")
+        embeddings = [None] * len(terms)
+        
+        # Probe the on-disk cache; any cache failure just means every term is a miss
+        cache_keys = []
+        if cache_path:
+            cache_keys = [_embedding_cache_key(embedding_provider, term) for term in terms]
+            try:
+                cache_conn = _open_embedding_cache(cache_path)
+                cached = _read_cached_embeddings(cache_conn, cache_keys)
+                for i, key in enumerate(cache_keys):
+                    embeddings[i] = cached.get(key)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache unavailable at {cache_path}: {e}")
+                if cache_conn is not None:
+                    cache_conn.close()
+                    cache_conn = None
+        
+        missing = [i for i, vector in enumerate(embeddings) if vector is None]
+        if missing:
+            fetched = _embed_terms(embedding_provider, [terms[i] for i in missing], batch_size, max_workers, max_retries)
+            if len(fetched) != len(missing) or not all(len(vector) for vector in fetched):
+                logger.error(f"Embedding provider returned {len(fetched)} vectors (some possibly empty) for {len(missing)} terms")
+                return []
+            for i, vector in zip(missing, fetched):
+                embeddings[i] = vector
+        
+        # One contiguous float32 matrix; rows are converted to lists only at the Cypher boundary
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        
+        if cache_conn is not None and missing:
+            try:
+                _write_cached_embeddings(cache_conn, [(cache_keys[i], embeddings[i]) for i in missing])
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write embedding cache at {cache_path}: {e}")
+        
+        if cache_path:
+            logger.info(f"Embedding cache: {len(terms) - len(missing)} hits, {len(missing)} misses")
         return embeddings
     except Exception as e:
         logger.error(f"Failed to compute embeddings: {e}")
         return []
+    finally:
+        if cache_conn is not None:
+            cache_conn.close()
+
+def _embedding_hash(embedding) -> str:
+    """Stable content hash of an embedding (sha1 of its float32 bytes)."""
+    return hashlib.sha1(np.asarray(embedding, dtype=np.float32).tobytes()).hexdigest()
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length (zero rows are left as zeros)."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
 
 def generate_schema_embeddings() -> List[Dict[str, Any]]:
     """
     Generate complete schema embeddings by collecting terms and computing embeddings.
     
+    Vectors are L2-normalized (``schema_embeddings.normalize``, on by default)
+    so cosine similarity reduces to a dot product, and can optionally be
+    stored as float16 (``schema_embeddings.fp16``).
+    
     Returns:
         List of dicts with term info and embeddings:
         [{"id": "<type>:<term>", "term": "<term>", "type": "label|relationship|property", 
-          "canonical_id": "<canonical>", "embedding": [...]}]
+          "canonical_id": "<canonical>", "embedding": <float32 ndarray>}]
     """
+    with open("config.yaml", 'r') as f:
+        cfg = yaml.safe_load(f)
+    schema_embeddings_cfg = cfg.get('schema_embeddings', {})
+    normalize = schema_embeddings_cfg.get('normalize', True)
+    use_fp16 = schema_embeddings_cfg.get('fp16', False)
+    
     # Collect schema terms
     terms_data = collect_schema_terms()
     if not terms_data:
         logger.warning("No schema terms collected")
         return []
     
-    # Extract just the term strings for embedding
-    term_strings = [term_data['term'] for term_data in terms_data]
+    # Validate once up front so the upsert can build rows without per-row checks
+    valid_terms = [term_data for term_data in terms_data if all(key in term_data for key in REQUIRED_TERM_KEYS)]
+    if len(valid_terms) != len(terms_data):
+        logger.warning(f"Skipping {len(terms_data) - len(valid_terms)} schema terms with missing fields")
+        terms_data = valid_terms
+        if not terms_data:
+            return []
+    
+    # Embed each distinct surface string once (order-preserving de-dupe)
+    term_strings = list(dict.fromkeys(term_data['term'] for term_data in terms_data))
     
-    # Compute embeddings
-    embeddings = compute_embeddings(term_strings)
+    # Compute embeddings, reusing the last result for an identical term list
+    provider_key = _provider_cache_key(get_embedding_provider())
+    cached = _SCHEMA_EMBEDDINGS_CACHE.get(provider_key)
+    if cached is not None and cached[0] == tuple(term_strings):
+        embeddings = cached[1]
+        logger.info(f"Reusing cached embeddings for {len(term_strings)} schema terms")
+    else:
+        embeddings = compute_embeddings(term_strings)
+        if len(embeddings) == len(term_strings):
+            _SCHEMA_EMBEDDINGS_CACHE[provider_key] = (tuple(term_strings), embeddings)
     if len(embeddings) != len(term_strings):
         logger.error(f"Mismatch: {len(term_strings)} terms but {len(embeddings)} embeddings")
         return []
     
-    # Combine term data with embeddings
-    result = []
-    for term_data, embedding in zip(terms_data, embeddings):
-        result.append({
-            **term_data,
-            "embedding": embedding
-        })
+    # Whole-matrix passes; the cached matrix itself is left untouched
+    if normalize:
+        embeddings = _l2_normalize(embeddings)
+    if use_fp16:
+        embeddings = embeddings.astype(np.float16)
+    
+    # Scatter embeddings back onto every term sharing that string. terms_data
+    # holds fresh copies from collect_schema_terms, so it is safe to mutate.
+    embedding_by_term = dict(zip(term_strings, embeddings))
+    for term_data in terms_data:
+        term_data['embedding'] = embedding_by_term[term_data['term']]
+    
+    logger.info(f"Generated schema embeddings for {len(terms_data)} terms")
+    return terms_data
+
+def drop_schema_vector_index(neo4j_client: Neo4jClient, index_name: str, timeout: int) -> None:
+    """
+    Drop the schema vector index if it exists.
+    
+    Args:
+        neo4j_client: Client used to run the statement
+        index_name: Name of the vector index
+        timeout: Query timeout in seconds
+    """
+    neo4j_client.execute_write_query(
+        f"DROP INDEX `{index_name}` IF EXISTS",
+        {},
+        timeout=timeout,
+        query_name="drop_schema_vector_index"
+    )
+    logger.info(f"Vector index '{index_name}' dropped ahead of bulk upsert")
+
+def create_schema_vector_index(neo4j_client: Neo4jClient, index_name: str, embedding_dim: int, timeout: int) -> None:
+    """
+    Create the schema vector index if it does not already exist.
+    
+    Args:
+        neo4j_client: Client used to run the statement
+        index_name: Name of the vector index
+        embedding_dim: Embedding dimensions
+        timeout: Query timeout in seconds
+    """
+    # Index name and dimensions cannot be Cypher parameters. Embeddings are
+    # L2-normalized, so the similarity function must stay 'cosine' (or 'dot')
+    index_query = f"""
+    CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS 
+    FOR (s:SchemaTerm) ON (s.embedding) 
+    OPTIONS {{
+        indexConfig: {{
+            `vector.dimensions`: {embedding_dim}, 
+            `vector.similarity_function`: 'cosine'
+        }}
+    }}
+    """
+    
+    neo4j_client.execute_write_query(
+        index_query, 
+        {}, 
+        timeout=timeout,
+        query_name="create_schema_vector_index"
+    )
     
-    logger.info(f"Generated schema embeddings for {len(result)} terms")
-    return result
+    logger.info(f"Vector index '{index_name}' created/verified with {embedding_dim} dimensions")
 
-def upsert_schema_embeddings() -> Dict[str, Any]:
+def upsert_schema_embeddings(rebuild_index: bool = False) -> Dict[str, Any]:
     """
     Upsert schema embeddings into Neo4j as SchemaTerm nodes and create vector index.
     
+    Args:
+        rebuild_index: Drop the vector index before writing and build it once
+            afterwards, instead of maintaining it row by row. Only for bulk
+            reloads: semantic lookups fail until the rebuilt index is ONLINE.
+            Routine refreshes keep the live index, which is created if missing.
+    
     Returns:
         Dict with operation results and statistics
     """
@@ -163,6 +496,8 @@ def upsert_schema_embeddings() -> Dict[str, Any]:
     timeout = cfg.get('guardrails', {}).get('neo4j_timeout', 10)
     index_name = cfg.get('schema_embeddings', {}).get('index_name', 'schema_embeddings')
     node_label = cfg.get('schema_embeddings', {}).get('node_label', 'SchemaTerm')
+    batch_size = cfg.get('schema_embeddings', {}).get('upsert_batch_size', DEFAULT_UPSERT_BATCH_SIZE)
+    concurrency = cfg.get('schema_embeddings', {}).get('upsert_concurrency', DEFAULT_UPSERT_CONCURRENCY)
     
     # Generate schema embeddings
     schema_data = generate_schema_embeddings()
@@ -173,87 +508,81 @@ def upsert_schema_embeddings() -> Dict[str, Any]:
     # Initialize Neo4j client
     neo4j_client = Neo4jClient()
     
+    embedding_dim = len(schema_data[0]['embedding'])
+    
+    if rebuild_index:
+        try:
+            drop_schema_vector_index(neo4j_client, index_name, timeout)
+        except Exception as e:
+            logger.warning(f"Failed to drop vector index '{index_name}' before upsert: {e}")
+    
     # Upsert schema term nodes
     nodes_created = 0
     nodes_updated = 0
+    nodes_failed = 0
     
-    logger.info(f"Upserting {len(schema_data)} schema term nodes...")
-    
-    for term_data in schema_data:
-        # Validate required fields
-        if not all(key in term_data for key in ['id', 'term', 'type', 'embedding']):
-            logger.warning(f"Skipping term with missing fields: {term_data}")
-            continue
-        
-        # Prepare parameters for Cypher query
-        params = {
+    # generate_schema_embeddings guarantees the required keys on every term
+    rows = [
+        {
             'id': term_data['id'],
             'term': term_data['term'],
             'type': term_data['type'],
             'canonical_id': term_data.get('canonical_id', term_data['term']),
-            'embedding': term_data['embedding']
+            # Cypher parameters need plain lists; convert float32 rows only here
+            'embedding': term_data['embedding'].tolist() if isinstance(term_data['embedding'], np.ndarray) else term_data['embedding'],
+            'embedding_hash': _embedding_hash(term_data['embedding'])
         }
-        
-        # Parameterized MERGE query
-        cypher_query = """
-        MERGE (s:SchemaTerm {id: $id})
-        SET s.term = $term, 
-            s.type = $type, 
-            s.canonical_id = $canonical_id,
-            s.embedding = $embedding,
-            s.updated_at = datetime()
-        RETURN s.id as id, 
-               CASE WHEN s.created_at IS NULL THEN 'created' ELSE 'updated' END as operation
-        """
-        
-        try:
-            result = neo4j_client.execute_write_query(
-                cypher_query, 
-                params, 
+        for term_data in schema_data
+    ]
+    
+    logger.info(f"Upserting {len(rows)} schema term nodes in batches of {batch_size}...")
+    
+    batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+    
+    # Batches touch disjoint ids, so they are written concurrently. Sessions
+    # are not thread-safe, so each worker gets its own share of batches and
+    # writes them through one session rather than one session per batch.
+    workers = max(1, min(concurrency, len(batches)))
+    worker_batches = [batches[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                neo4j_client.execute_write_batches,
+                SCHEMA_TERM_UPSERT_QUERY,
+                [{'rows': batch} for batch in share],
                 timeout=timeout,
-                query_name="upsert_schema_term"
+                query_name="upsert_schema_terms"
             )
+            for share in worker_batches
+        ]
+        
+        for share, future in zip(worker_batches, futures):
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                logger.error(f"Failed to upsert {len(share)} schema term batches starting at {share[0][0]['id']}: {e}")
+                nodes_failed += sum(len(batch) for batch in share)
+                continue
             
-            if result and len(result) > 0:
-                operation = result[0].get('operation', 'unknown')
-                if operation == 'created':
-                    nodes_created += 1
-                else:
-                    nodes_updated += 1
-                    
-        except Exception as e:
-            logger.error(f"Failed to upsert schema term {term_data['id']}: {e}")
-            continue
+            for batch, result in zip(share, batch_results):
+                if result is None:
+                    # execute_write_batches already logged the error
+                    nodes_failed += len(batch)
+                    continue
+                for record in result:
+                    if record.get('operation') == 'created':
+                        nodes_created += 1
+                    else:
+                        nodes_updated += 1
     
-    logger.info(f"Schema term upsert complete: {nodes_created} created, {nodes_updated} updated")
+    logger.info(f"Schema term upsert complete: {nodes_created} created, {nodes_updated} updated, {nodes_failed} failed")
+    # Mappings resolved against the previous schema terms may now be stale
+    _clear_planner_mapping_cache()
     
-    # Create vector index
+    # Build the vector index in bulk now that all rows are written
     try:
-        # Get embedding dimensions from first embedding
-        embedding_dim = len(schema_data[0]['embedding']) if schema_data else 1536
-        
-        # Create vector index with parameterized query
-        index_query = f"""
-        CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS 
-        FOR (s:SchemaTerm) ON (s.embedding) 
-        OPTIONS {{
-            indexConfig: {{
-                `vector.dimensions`: {embedding_dim}, 
-                `vector.similarity_function`: 'cosine'
-            }}
-        }}
-        """
-        
-        neo4j_client.execute_write_query(
-            index_query, 
-            {}, 
-            timeout=timeout,
-            query_name="create_schema_vector_index"
-        )
-        
-        logger.info(f"Vector index '{index_name}' created/verified with {embedding_dim} dimensions")
+        create_schema_vector_index(neo4j_client, index_name, embedding_dim, timeout)
         index_status = "created_or_verified"
-        
     except Exception as e:
         logger.error(f"Failed to create vector index '{index_name}': {e}")
         index_status = "failed"
@@ -262,6 +591,7 @@ def upsert_schema_embeddings() -> Dict[str, Any]:
         "status": "completed",
         "nodes_created": nodes_created,
         "nodes_updated": nodes_updated,
+        "nodes_failed": nodes_failed,
         "total_terms": len(schema_data),
         "index_name": index_name,
         "index_status": index_status,
@@ -271,13 +601,14 @@ def upsert_schema_embeddings() -> Dict[str, Any]:
 # CLI entry point
 if __name__ == "__main__":
     print("=== Schema Embeddings Upsert ===")
-    result = upsert_schema_embeddings()
+    result = upsert_schema_embeddings(rebuild_index="--rebuild-index" in sys.argv[1:])
     print(f"Result: {result}")
     
     if result["status"] == "completed":
         print(f"✅ Successfully processed {result['total_terms']} schema terms")
         print(f"   - Created: {result['nodes_created']} nodes")
         print(f"   - Updated: {result['nodes_updated']} nodes")
+        print(f"   - Failed: {result['nodes_failed']} nodes")
         print(f"   - Index: {result['index_name']} ({result['index_status']})")
     else:
         print(f"⚠️  Operation {result['status']}: {result.get('reason', 'unknown')}")
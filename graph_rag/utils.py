@@ -1,4 +1,48 @@
 # graph_rag/utils.py
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    # orjson is in requirements.txt, but keep the stdlib path working without it
+    orjson = None
+
 def approx_tokens(text: str) -> int:
-    # rough heuristic: 1 token ~ 4 chars
-    return max(1, len(text) // 4)
+    # rough heuristic: 1 token ~ 4 chars, never less than 1
+    return len(text) >> 2 or 1
+
+def append_to_file(path: str, payload: bytes) -> None:
+    """
+    Append ``payload`` to ``path`` through one O_APPEND descriptor.
+
+    os.write may write less than asked (signals, full disks), so loop until
+    every byte is out; a short write would otherwise leave a truncated line.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def json_dumps_line(obj) -> bytes:
+    """Serialize ``obj`` as one newline-terminated JSONL record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+def json_loads(data):
+    """Parse JSON from str, bytes or a buffer such as an mmap view."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -1,9 +1,13 @@
 # main.py
+import asyncio
+import contextvars
 import os
+import secrets
+import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from graph_rag.rag import rag_chain
 from graph_rag.observability import start_metrics_server, get_logger
 from graph_rag.conversation_store import conversation_store
 from graph_rag.sanitizer import sanitize_text, is_probably_malicious
@@ -17,33 +21,86 @@ with open("config.yaml", 'r') as f:
 logger = get_logger(__name__)
 app = FastAPI(title="GraphRAG")
 
+# Request screening and RAG calls get their own bounded pool instead of sharing
+# the default executor, so a burst of chats queues here rather than starving
+# other thread work
+RAG_WORKERS = int(os.getenv("RAG_WORKERS", "8"))
+RAG_REQUEST_TIMEOUT_S = cfg.get("llm", {}).get("request_timeout_s", 60)
+_rag_executor = None
+
+def _get_rag_executor() -> ThreadPoolExecutor:
+    global _rag_executor
+    if _rag_executor is None:
+        _rag_executor = ThreadPoolExecutor(max_workers=RAG_WORKERS, thread_name_prefix="rag")
+    return _rag_executor
+
+def _run_in_rag_executor(func, *args):
+    """Run ``func(*args)`` on the RAG pool, keeping the caller's contextvars (trace span)."""
+    # run_in_executor does not carry contextvars over, so run inside a copy
+    ctx = contextvars.copy_context()
+    return asyncio.get_running_loop().run_in_executor(_get_rag_executor(), ctx.run, func, *args)
+
+# graph_rag.rag pulls in langchain/OpenAI and builds the Neo4j-backed chain, so
+# it is imported on the first chat rather than at worker start
+rag_chain = None
+
+def _get_rag_chain():
+    global rag_chain
+    if rag_chain is None:
+        from graph_rag.rag import rag_chain as chain
+        rag_chain = chain
+    return rag_chain
+
+def _invoke_rag(question: str) -> dict:
+    # Runs on the RAG pool, so the first-call import never blocks the event loop
+    return _get_rag_chain().invoke(question)
+
+def _screen_question(question: str) -> tuple[str, bool]:
+    """Sanitize ``question`` and run the heuristic check on the original text."""
+    return sanitize_text(question), is_probably_malicious(question)
+
 @app.on_event("startup")
 def startup_event():
     conversation_store.init()
     if cfg.get("observability", {}).get("metrics_enabled", True):
         start_metrics_server()
 
+@app.on_event("shutdown")
+def shutdown_event():
+    global _rag_executor
+    if _rag_executor is not None:
+        _rag_executor.shutdown(wait=True)
+        _rag_executor = None
+    if rag_chain is not None:
+        # The planner only holds a Neo4j driver once the RAG chain has been loaded
+        from graph_rag.planner import close_neo4j_client
+        close_neo4j_client()
+    audit_store.close()
+
 class ChatRequest(BaseModel):
     conversation_id: str | None = None
     question: str
 
 @app.post("/api/chat")
-def chat(req: ChatRequest):
+async def chat(req: ChatRequest):
+    # Blocking LLM / Neo4j / file work runs in worker threads so the event
+    # loop stays free to serve other requests
     if not req.question:
         raise HTTPException(400, "Question is required")
 
-    # Sanitize the input immediately
+    # Sanitize the input immediately and check if the original question is
+    # probably malicious, in a single hop off the event loop
     original_question = req.question
-    req.question = sanitize_text(req.question)
+    req.question, malicious = await _run_in_rag_executor(_screen_question, original_question)
     
-    # Check if the original question is probably malicious
-    if is_probably_malicious(original_question):
-        # Record audit entry
-        audit_store.record({
+    if malicious:
+        # Record audit entry; record() may wait on a full queue, so keep it off the loop
+        await asyncio.to_thread(audit_store.record, {
             "type": "malicious_input_blocked",
             "original_question": original_question,
             "sanitized_question": req.question,
-            "timestamp": str(uuid.uuid4()),  # Using uuid as simple timestamp placeholder
+            "timestamp_ns": time.time_ns(),
+            "event_id": secrets.token_hex(8),
             "action": "blocked_403",
             "check_type": "heuristic"
         })
@@ -51,13 +108,14 @@ def chat(req: ChatRequest):
         raise HTTPException(403, "Input flagged for manual review")
 
     # Run LLM guardrail check on sanitized input
-    if not guardrail_check(req.question):
+    if not await _run_in_rag_executor(guardrail_check, req.question):
         # Record audit entry for guardrail block
-        audit_store.record({
+        await asyncio.to_thread(audit_store.record, {
             "type": "guardrail_blocked",
             "original_question": original_question,
             "sanitized_question": req.question,
-            "timestamp": str(uuid.uuid4()),
+            "timestamp_ns": time.time_ns(),
+            "event_id": secrets.token_hex(8),
             "action": "blocked_403",
             "check_type": "llm_guardrail"
         })
@@ -66,13 +124,27 @@ def chat(req: ChatRequest):
 
     conv_id = req.conversation_id if req.conversation_id else str(uuid.uuid4())
     
-    conversation_store.add_message(conv_id, {"role": "user", "text": req.question})
+    # The question has passed both checks, so store the user turn while the
+    # RAG call runs instead of before it
+    user_append = asyncio.create_task(
+        asyncio.to_thread(conversation_store.add_message, conv_id, {"role": "user", "text": req.question})
+    )
 
     try:
-        resp = rag_chain.invoke(req.question)
-        conversation_store.add_message(conv_id, {"role": "assistant", "text": resp.get("answer"), "trace_id": resp.get("trace_id")})
+        try:
+            resp = await asyncio.wait_for(
+                _run_in_rag_executor(_invoke_rag, req.question),
+                timeout=RAG_REQUEST_TIMEOUT_S
+            )
+        finally:
+            # Keep user-before-assistant ordering, and don't leave the write dangling on errors
+            await user_append
+        await asyncio.to_thread(conversation_store.add_message, conv_id, {"role": "assistant", "text": resp.get("answer"), "trace_id": resp.get("trace_id")})
         resp["conversation_id"] = conv_id
         return resp
+    except asyncio.TimeoutError:
+        logger.error(f"RAG request timed out after {RAG_REQUEST_TIMEOUT_S}s")
+        raise HTTPException(504, "request timed out")
     except Exception as e:
         logger.error(f"Error in /api/chat: {e}")
         raise HTTPException(500, "internal error")
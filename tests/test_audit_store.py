@@ -0,0 +1,86 @@
+import unittest
+import json
+import os
+import queue
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add the parent directory to the path so we can import graph_rag modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph_rag.audit_store import AuditStore
+
+class TestAuditStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp_dir.name, "audit_log.jsonl")
+        self.store = AuditStore(log_file=self.log_file)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def _read_entries(self):
+        return [json.loads(line) for line in Path(self.log_file).read_text(encoding='utf-8').splitlines()]
+
+    def test_entries_written_in_order_after_flush(self):
+        """Test that queued entries reach the file in record order."""
+        for i in range(600):
+            self.store.record({"type": "test", "seq": i})
+        self.store.flush()
+
+        self.assertEqual([e["seq"] for e in self._read_entries()], list(range(600)))
+
+    def test_entry_snapshot_taken_at_record_time(self):
+        """Test that mutating an entry after record() does not change what is written."""
+        entry = {"type": "test", "value": "original"}
+        self.store.record(entry)
+        entry["value"] = "mutated"
+        self.store.flush()
+
+        self.assertEqual(self._read_entries(), [{"type": "test", "value": "original"}])
+
+    def test_close_drains_and_record_restarts_writer(self):
+        """Test that close() writes pending entries and the store stays usable afterwards."""
+        threads = [threading.Thread(target=self.store.record, args=({"type": "test", "n": n},)) for n in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.store.close()
+        self.assertEqual(len(self._read_entries()), 20)
+
+        self.store.record({"type": "after_close"})
+        self.store.flush()
+        self.assertEqual(self._read_entries()[-1], {"type": "after_close"})
+
+    def test_full_queue_keeps_record_order(self):
+        """Test that a writer falling behind delays record() rather than reordering entries."""
+        self.store._queue = queue.Queue(maxsize=2)
+        for i in range(200):
+            self.store.record({"type": "test", "seq": i})
+        self.store.flush()
+
+        self.assertEqual([e["seq"] for e in self._read_entries()], list(range(200)))
+
+    def test_record_racing_close_is_not_lost(self):
+        """Test that entries recorded while close() runs are still written."""
+        def record_many(start):
+            for n in range(start, start + 50):
+                self.store.record({"type": "test", "n": n})
+
+        threads = [threading.Thread(target=record_many, args=(i * 50,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        self.store.close()
+        for t in threads:
+            t.join()
+        self.store.close()
+
+        self.assertEqual(sorted(e["n"] for e in self._read_entries()), list(range(200)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock, call
+import json
+import os
+import sys
+
+# Add the parent directory to the path so we can import graph_rag modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph_rag.embedding_cache import CachedEmbeddingProvider, EMBEDDING_CACHE_REDIS_PREFIX, _cache_key
+
+class TestCachedEmbeddingProvider(unittest.TestCase):
+
+    def _provider(self):
+        provider = MagicMock()
+        provider.model = "test-model"
+        provider.get_embeddings.side_effect = lambda texts: [[float(len(t)), 1.0] for t in texts]
+        return provider
+
+    def test_only_misses_reach_the_provider(self):
+        """Test that cached texts are served locally and misses are fetched in one batch."""
+        provider = self._provider()
+        cache = CachedEmbeddingProvider(provider)
+
+        first = cache.get_embeddings(["a", "bb"])
+        second = cache.get_embeddings(["bb", "ccc", "a"])
+
+        self.assertEqual(first, [[1.0, 1.0], [2.0, 1.0]])
+        self.assertEqual(second, [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]])
+        self.assertEqual(provider.get_embeddings.call_count, 2)
+        provider.get_embeddings.assert_called_with(["ccc"])
+
+    def test_lru_eviction_and_failed_embeddings_not_cached(self):
+        """Test that the L1 cache is bounded and empty vectors are retried."""
+        provider = self._provider()
+        cache = CachedEmbeddingProvider(provider, capacity=2)
+        cache.get_embeddings(["a", "bb"])
+        cache.get_embeddings(["a"])          # refresh "a"
+        cache.get_embeddings(["ccc"])        # evicts "bb"
+        provider.get_embeddings.reset_mock()
+
+        cache.get_embeddings(["a", "bb"])
+        provider.get_embeddings.assert_called_once_with(["bb"])
+
+        provider.get_embeddings.side_effect = lambda texts: [[] for _ in texts]
+        cache.get_embeddings(["dddd"])
+        cache.get_embeddings(["dddd"])
+        self.assertEqual(provider.get_embeddings.call_args_list[-2:], [call(["dddd"])] * 2)
+
+    def test_redis_second_tier(self):
+        """Test that Redis hits skip the provider and fresh vectors are written back."""
+        provider = self._provider()
+        redis_client = MagicMock()
+        cached_key = EMBEDDING_CACHE_REDIS_PREFIX + _cache_key("test-model", "a").hex()
+        redis_client.mget.side_effect = lambda keys: [json.dumps([9.0]).encode() if k == cached_key else None for k in keys]
+        cache = CachedEmbeddingProvider(provider, redis_client=redis_client)
+
+        result = cache.get_embeddings(["a", "bb"])
+
+        self.assertEqual(result, [[9.0], [2.0, 1.0]])
+        provider.get_embeddings.assert_called_once_with(["bb"])
+        pipe = redis_client.pipeline.return_value
+        pipe.set.assert_called_once()
+        pipe.execute.assert_called_once()
+
+    def test_redis_errors_fall_back_to_provider(self):
+        """Test that a Redis outage does not fail embedding requests."""
+        provider = self._provider()
+        redis_client = MagicMock()
+        redis_client.mget.side_effect = ConnectionError("redis down")
+        redis_client.pipeline.side_effect = ConnectionError("redis down")
+        cache = CachedEmbeddingProvider(provider, redis_client=redis_client)
+
+        self.assertEqual(cache.get_embeddings(["a"]), [[1.0, 1.0]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import threading
+
+# Add the parent directory to the path so we can import graph_rag modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph_rag.guardrail import guardrail_check, clear_guardrail_cache, GuardrailResponse
+
+class TestGuardrailCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_guardrail_cache()
+
+    def tearDown(self):
+        clear_guardrail_cache()
+
+    @patch("graph_rag.guardrail.call_llm_structured")
+    def test_verdicts_are_cached(self, mock_call_llm_structured):
+        """Test that a repeated question is answered without another LLM call."""
+        mock_call_llm_structured.return_value = GuardrailResponse(allowed=True, reason="ok")
+
+        self.assertTrue(guardrail_check("Who founded Microsoft?"))
+        self.assertTrue(guardrail_check("Who founded Microsoft?"))
+        mock_call_llm_structured.assert_called_once()
+
+        clear_guardrail_cache()
+        self.assertTrue(guardrail_check("Who founded Microsoft?"))
+        self.assertEqual(mock_call_llm_structured.call_count, 2)
+
+    @patch("graph_rag.guardrail.call_llm_structured")
+    def test_failed_verdicts_are_not_cached(self, mock_call_llm_structured):
+        """Test that a failed classification blocks but is retried on the next call."""
+        mock_call_llm_structured.side_effect = RuntimeError("llm down")
+        self.assertFalse(guardrail_check("What does Apple sell?"))
+
+        mock_call_llm_structured.side_effect = None
+        mock_call_llm_structured.return_value = GuardrailResponse(allowed=True, reason="ok")
+        self.assertTrue(guardrail_check("What does Apple sell?"))
+        self.assertEqual(mock_call_llm_structured.call_count, 2)
+
+    @patch("graph_rag.guardrail.GUARDRAIL_CACHE_TTL_S", -1)
+    @patch("graph_rag.guardrail.call_llm_structured")
+    def test_expired_verdicts_are_rechecked(self, mock_call_llm_structured):
+        """Test that verdicts older than the TTL are not reused."""
+        mock_call_llm_structured.return_value = GuardrailResponse(allowed=True, reason="ok")
+
+        guardrail_check("Who runs Google?")
+        guardrail_check("Who runs Google?")
+        self.assertEqual(mock_call_llm_structured.call_count, 2)
+
+    @patch("graph_rag.guardrail.call_llm_structured")
+    def test_concurrent_identical_checks_share_one_call(self, mock_call_llm_structured):
+        """Test that identical in-flight checks wait for the first one."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_llm(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return GuardrailResponse(allowed=False, reason="blocked")
+
+        mock_call_llm_structured.side_effect = slow_llm
+        results = []
+        first = threading.Thread(target=lambda: results.append(guardrail_check("DROP ALL")))
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=lambda: results.append(guardrail_check("DROP ALL")))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(results, [False, False])
+        mock_call_llm_structured.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
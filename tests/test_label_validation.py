@@ -1,8 +1,9 @@
 import unittest
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, MagicMock
 import json
 import os
 import sys
+from types import MappingProxyType
 from prometheus_client import REGISTRY
 
 class TestLabelValidation(unittest.TestCase):
@@ -91,3 +92,63 @@ class TestLabelValidation(unittest.TestCase):
         
         self.assertEqual(gen.validate_relationship_type("NonExistentREL"), "`RELATED`")
         mock_logger.warning.assert_called_with("Invalid relationship type 'NonExistentREL' provided. Falling back to default 'RELATED'.")
+
+    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({
+        "node_labels": ["Document", "Entity", "Person"],
+        "relationship_types": ["HAS_CHUNK", "MENTIONS"],
+        "properties": {}
+    }))
+    @patch("graph_rag.cypher_generator.logger")
+    def test_allow_list_parsed_once_until_file_changes(self, mock_logger, mock_file_open):
+        import graph_rag.cypher_generator
+        opens_before = mock_file_open.call_count
+        with patch("os.stat", return_value=MagicMock(st_mtime_ns=1, st_size=100)) as mock_stat:
+            graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+            gen = graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+            self.assertEqual(mock_file_open.call_count - opens_before, 1)
+            self.assertTrue(gen.validate_label("Person"))
+            
+            # A modified file is re-read
+            mock_stat.return_value = MagicMock(st_mtime_ns=2, st_size=100)
+            graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+            self.assertEqual(mock_file_open.call_count - opens_before, 2)
+
+    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({
+        "node_labels": ["Document", "Entity", "Person"],
+        "relationship_types": ["HAS_CHUNK", "MENTIONS"],
+        "properties": {"Person": ["name"]}
+    }))
+    def test_cached_allow_list_is_read_only(self, mock_file_open):
+        import graph_rag.cypher_generator
+        with patch("os.stat", return_value=MagicMock(st_mtime_ns=1, st_size=100)):
+            gen = graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+            with self.assertRaises(TypeError):
+                gen.allow_list["node_labels"] = []
+            with self.assertRaises(AttributeError):
+                gen.allow_list["properties"]["Person"].append("age")
+            other = graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+            self.assertEqual(other.allow_list["properties"]["Person"], ("name",))
+
+    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({
+        "node_labels": ["Document", "Entity", "Person"],
+        "relationship_types": ["HAS_CHUNK", "MENTIONS"],
+        "properties": {}
+    }))
+    def test_reassigned_allow_list_is_used_for_validation(self, mock_file_open):
+        import graph_rag.cypher_generator
+        gen = graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+        gen.allow_list = {"node_labels": ["Company"], "relationship_types": ["OWNS"], "properties": {}}
+        
+        self.assertEqual(gen.validate_label("Company"), "`Company`")
+        self.assertEqual(gen.validate_label("Person"), "`Entity`")
+        self.assertEqual(gen.validate_relationship_type("OWNS"), "`OWNS`")
+        self.assertEqual(gen.validate_relationship_type("MENTIONS"), "`RELATED`")
+
+    def test_missing_allow_list_is_read_only_too(self):
+        import graph_rag.cypher_generator
+        with patch("builtins.open", side_effect=FileNotFoundError("allow_list.json")):
+            gen = graph_rag.cypher_generator.CypherGenerator("allow_list.json")
+        
+        self.assertIsInstance(gen.allow_list, MappingProxyType)
+        self.assertEqual(gen.allow_list["node_labels"], ())
+        self.assertEqual(gen.validate_label("Person"), "`Entity`")
@@ -38,3 +38,24 @@ class TestNeo4jClientTimeout(unittest.TestCase):
         mock_driver_instance.session.assert_called_once_with(default_access_mode="READ")
         mock_session.begin_transaction.assert_called_once_with(timeout=0.1)
         mock_db_query_failed.inc.assert_called_once()
+
+    def test_execute_write_batches_reuses_one_session(self, mock_graph_database):
+        mock_driver_instance = MagicMock()
+        mock_graph_database.driver.return_value = mock_driver_instance
+        mock_driver_instance.verify_connectivity.return_value = None
+
+        mock_session = MagicMock()
+        mock_driver_instance.session.return_value.__enter__.return_value = mock_session
+        # First batch commits, second fails
+        mock_session.execute_write.side_effect = [
+            [{"id": "a"}],
+            exceptions.ClientError("a", "b", "The transaction has been terminated due to a timeout"),
+        ]
+
+        import graph_rag.neo4j_client
+        client = graph_rag.neo4j_client.Neo4jClient()
+
+        results = client.execute_write_batches("UNWIND $rows AS row RETURN row.id AS id", [{"rows": [1]}, {"rows": [2]}], timeout=0.1)
+        self.assertEqual(results, [[{"id": "a"}], None])
+        mock_driver_instance.session.assert_called_once_with(default_access_mode="WRITE")
+        self.assertEqual(mock_session.execute_write.call_count, 2)
@@ -17,6 +17,12 @@ class TestPlannerEndToEnd(unittest.TestCase):
     """End-to-end integration tests for planner with schema embeddings fallback."""
 
     def setUp(self):
+        # Drop the planner's shared Neo4j client and mapping cache so each test's patches apply
+        planner = sys.modules.get('graph_rag.planner')
+        if planner is not None:
+            planner.close_neo4j_client()
+            planner.clear_semantic_mapping_cache()
+        
         # Clear module cache and Prometheus registry
         for module_name in [
             'graph_rag.planner',
@@ -227,7 +233,8 @@ class TestPlannerEndToEnd(unittest.TestCase):
         # Verify vector query structure
         vector_call_args = mock_neo4j_client.execute_read_query.call_args
         query = vector_call_args[0][0]
-        self.assertIn("CALL db.index.vector.queryNodes('schema_embeddings'", query)
+        self.assertIn("CALL db.index.vector.queryNodes($index, $top_k, $embedding)", query)
+        self.assertEqual(vector_call_args[0][1]['index'], "schema_embeddings")
         
         # Verify label validation was called
         mock_cypher_generator.validate_label.assert_called_once_with("Organization")
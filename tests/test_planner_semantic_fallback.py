@@ -12,6 +12,12 @@ from graph_rag.planner import generate_plan, _find_best_anchor_entity_semantic
 class TestPlannerSemanticFallback(unittest.TestCase):
 
     def setUp(self):
+        # Drop the planner's shared Neo4j client and mapping cache so each test's patches apply
+        planner = sys.modules.get('graph_rag.planner')
+        if planner is not None:
+            planner.close_neo4j_client()
+            planner.clear_semantic_mapping_cache()
+        
         # Clear module cache and Prometheus registry
         for module_name in [
             'graph_rag.planner',
@@ -102,12 +108,13 @@ class TestPlannerSemanticFallback(unittest.TestCase):
         
         # Check query structure
         query = call_args[0][0]
-        self.assertIn("CALL db.index.vector.queryNodes('test_schema_embeddings'", query)
+        self.assertIn("CALL db.index.vector.queryNodes($index, $top_k, $embedding)", query)
         self.assertIn("YIELD node, score", query)
         self.assertIn("RETURN node.id as id, node.term as term, node.type as type", query)
         
         # Check parameters
         params = call_args[0][1]
+        self.assertEqual(params['index'], "test_schema_embeddings")
         self.assertEqual(params['top_k'], 5)
         self.assertEqual(params['embedding'], [0.1, 0.2, 0.3, 0.4, 0.5])
         
@@ -330,5 +337,73 @@ class TestPlannerSemanticFallback(unittest.TestCase):
         result = _find_best_anchor_entity_semantic("   ")
         self.assertIsNone(result)
 
+    @patch("graph_rag.planner.CypherGenerator")
+    @patch("graph_rag.planner._get_neo4j_client")
+    @patch("graph_rag.planner.get_embedding_provider")
+    def test_find_best_anchor_entity_semantic_caches_mappings(self, mock_get_embedding_provider, mock_get_neo4j_client, mock_cypher_generator_class):
+        """Test that a repeated candidate is served from the mapping cache until it is cleared."""
+        from graph_rag.planner import _find_best_anchor_entity_semantic, clear_semantic_mapping_cache
+        
+        mock_embedding_provider = MagicMock()
+        mock_embedding_provider.get_embeddings.return_value = [[0.1, 0.2]]
+        mock_get_embedding_provider.return_value = mock_embedding_provider
+        mock_neo4j_client = mock_get_neo4j_client.return_value
+        mock_neo4j_client.execute_read_query.return_value = [
+            {'id': 'label:Organization', 'term': 'Organization', 'type': 'label',
+             'canonical_id': 'Organization', 'score': 0.95}
+        ]
+        mock_cypher_generator_class.return_value.validate_label.return_value = True
+        
+        first = _find_best_anchor_entity_semantic("Microsoft Corporation")
+        second = _find_best_anchor_entity_semantic(" Microsoft Corporation ")
+        
+        self.assertEqual(first, "Organization")
+        self.assertEqual(second, "Organization")
+        mock_embedding_provider.get_embeddings.assert_called_once_with(["Microsoft Corporation"])
+        mock_neo4j_client.execute_read_query.assert_called_once()
+        
+        # After new schema embeddings are loaded the mapping is looked up again
+        clear_semantic_mapping_cache()
+        _find_best_anchor_entity_semantic("Microsoft Corporation")
+        self.assertEqual(mock_neo4j_client.execute_read_query.call_count, 2)
+
+    @patch("graph_rag.planner.SEMANTIC_MAPPING_CACHE_TTL_S", -1)
+    @patch("graph_rag.planner.CypherGenerator")
+    @patch("graph_rag.planner._get_neo4j_client")
+    @patch("graph_rag.planner.get_embedding_provider")
+    def test_find_best_anchor_entity_semantic_mappings_expire(self, mock_get_embedding_provider, mock_get_neo4j_client, mock_cypher_generator_class):
+        """Test that expired mappings are looked up again, e.g. after another process re-upserts schema terms."""
+        from graph_rag.planner import _find_best_anchor_entity_semantic
+        
+        mock_get_embedding_provider.return_value.get_embeddings.return_value = [[0.1, 0.2]]
+        mock_neo4j_client = mock_get_neo4j_client.return_value
+        mock_neo4j_client.execute_read_query.return_value = [
+            {'id': 'label:Organization', 'term': 'Organization', 'type': 'label',
+             'canonical_id': 'Organization', 'score': 0.95}
+        ]
+        mock_cypher_generator_class.return_value.validate_label.return_value = True
+        
+        self.assertEqual(_find_best_anchor_entity_semantic("Microsoft Corporation"), "Organization")
+        self.assertEqual(_find_best_anchor_entity_semantic("Microsoft Corporation"), "Organization")
+        self.assertEqual(mock_neo4j_client.execute_read_query.call_count, 2)
+
+    @patch("graph_rag.planner.CypherGenerator")
+    @patch("graph_rag.planner._get_neo4j_client")
+    @patch("graph_rag.planner.get_embedding_provider")
+    def test_find_best_anchor_entity_semantic_does_not_cache_misses(self, mock_get_embedding_provider, mock_get_neo4j_client, mock_cypher_generator_class):
+        """Test that a candidate with no label match is searched again on the next call."""
+        from graph_rag.planner import _find_best_anchor_entity_semantic
+        
+        mock_get_embedding_provider.return_value.get_embeddings.return_value = [[0.1, 0.2]]
+        mock_neo4j_client = mock_get_neo4j_client.return_value
+        mock_neo4j_client.execute_read_query.return_value = [
+            {'id': 'rel:FOUNDED', 'term': 'FOUNDED', 'type': 'relationship',
+             'canonical_id': 'FOUNDED', 'score': 0.9}
+        ]
+        
+        self.assertIsNone(_find_best_anchor_entity_semantic("Acme Widgets"))
+        self.assertIsNone(_find_best_anchor_entity_semantic("Acme Widgets"))
+        self.assertEqual(mock_neo4j_client.execute_read_query.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
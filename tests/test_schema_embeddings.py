@@ -3,15 +3,21 @@ from unittest.mock import patch, mock_open, MagicMock
 import json
 import os
 import sys
+import tempfile
+
+import numpy as np
 
 # Add the parent directory to the path so we can import graph_rag modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from graph_rag.schema_embeddings import collect_schema_terms, compute_embeddings, generate_schema_embeddings
+from graph_rag.schema_embeddings import collect_schema_terms, compute_embeddings, generate_schema_embeddings, clear_schema_embedding_caches
 
 class TestSchemaEmbeddings(unittest.TestCase):
 
     def setUp(self):
+        # Results are memoized by file mtime; each test mocks different file contents
+        clear_schema_embedding_caches()
+        
         # Clear module cache
         for module_name in ['graph_rag.schema_embeddings', 'graph_rag.embeddings']:
             if module_name in sys.modules:
@@ -158,14 +164,38 @@ class TestSchemaEmbeddings(unittest.TestCase):
         embeddings = compute_embeddings(terms)
         
         # Verify embeddings
-        self.assertEqual(len(embeddings), 3)
-        self.assertEqual(embeddings[0], [0.1, 0.2, 0.3])
-        self.assertEqual(embeddings[1], [0.4, 0.5, 0.6])
-        self.assertEqual(embeddings[2], [0.7, 0.8, 0.9])
+        self.assertEqual(embeddings.dtype, np.float32)
+        self.assertEqual(embeddings.shape, (3, 3))
+        np.testing.assert_allclose(embeddings[0], [0.1, 0.2, 0.3], rtol=1e-6)
+        np.testing.assert_allclose(embeddings[1], [0.4, 0.5, 0.6], rtol=1e-6)
+        np.testing.assert_allclose(embeddings[2], [0.7, 0.8, 0.9], rtol=1e-6)
         
         # Verify embedding provider was called correctly
         mock_provider.get_embeddings.assert_called_once_with(terms)
 
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "mock_key"})
+    @patch("graph_rag.schema_embeddings.get_embedding_provider")
+    def test_compute_embeddings_uses_disk_cache(self, mock_get_embedding_provider):
+        """Test that cached terms are not sent to the provider again."""
+        from graph_rag.schema_embeddings import compute_embeddings
+        
+        mock_provider = MagicMock()
+        mock_provider.model = "test-model"
+        mock_provider.get_embeddings.side_effect = lambda batch: [[float(len(t)), 0.5] for t in batch]
+        mock_get_embedding_provider.return_value = mock_provider
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config_data = json.dumps({"embeddings": {"cache_path": os.path.join(cache_dir, "emb.sqlite")}})
+            with patch("builtins.open", mock_open(read_data=config_data)):
+                first = compute_embeddings(["Person", "Company"])
+                second = compute_embeddings(["Person", "Organization"])
+        
+        self.assertEqual(first.tolist(), [[6.0, 0.5], [7.0, 0.5]])
+        self.assertEqual(second.tolist(), [[6.0, 0.5], [12.0, 0.5]])
+        # Only the cache miss is embedded on the second call
+        self.assertEqual(mock_provider.get_embeddings.call_count, 2)
+        mock_provider.get_embeddings.assert_called_with(["Organization"])
+
     def test_compute_embeddings_empty_list(self):
         """Test computing embeddings for empty list."""
         embeddings = compute_embeddings([])
@@ -224,7 +254,7 @@ class TestSchemaEmbeddings(unittest.TestCase):
             self.assertIn("type", item)
             self.assertIn("canonical_id", item)
             self.assertIn("embedding", item)
-            self.assertIsInstance(item["embedding"], list)
+            self.assertIsInstance(item["embedding"], np.ndarray)
             self.assertEqual(len(item["embedding"]), 3)
         
         # Check specific items
@@ -232,7 +262,100 @@ class TestSchemaEmbeddings(unittest.TestCase):
         self.assertEqual(person_item["id"], "label:Person")
         self.assertEqual(person_item["type"], "label")
         self.assertEqual(person_item["canonical_id"], "Person")
-        self.assertEqual(person_item["embedding"], [0.1, 0.2, 0.3])
+        # Embeddings are L2-normalized by default
+        expected = np.array([0.1, 0.2, 0.3]) / np.linalg.norm([0.1, 0.2, 0.3])
+        np.testing.assert_allclose(person_item["embedding"], expected, rtol=1e-6)
+        np.testing.assert_allclose(np.linalg.norm(person_item["embedding"]), 1.0, rtol=1e-6)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "mock_key"})
+    @patch("graph_rag.schema_embeddings.get_embedding_provider")
+    @patch("graph_rag.schema_embeddings.collect_schema_terms")
+    def test_generate_schema_embeddings_skips_invalid_terms(self, mock_collect_schema_terms, mock_get_embedding_provider):
+        """Test that terms missing required fields are dropped before embedding."""
+        from graph_rag.schema_embeddings import generate_schema_embeddings
+        
+        mock_collect_schema_terms.return_value = [
+            {"id": "label:Person", "term": "Person", "type": "label", "canonical_id": "Person"},
+            {"id": "label:Invalid", "term": "Invalid", "canonical_id": "Invalid"}  # Missing 'type'
+        ]
+        mock_provider = MagicMock()
+        mock_provider.get_embeddings.return_value = [[0.6, 0.8]]
+        mock_get_embedding_provider.return_value = mock_provider
+        
+        config_data = json.dumps({"schema_embeddings": {}})
+        with patch("builtins.open", mock_open(read_data=config_data)):
+            result = generate_schema_embeddings()
+        
+        self.assertEqual([item["id"] for item in result], ["label:Person"])
+        mock_provider.get_embeddings.assert_called_once_with(["Person"])
+        np.testing.assert_allclose(result[0]["embedding"], [0.6, 0.8], rtol=1e-6)
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_collect_schema_terms_cached_until_file_changes(self, mock_file_open):
+        """Test that collected terms are reused while allow_list.json is unchanged."""
+        
+        config_data = json.dumps({
+            "schema": {"allow_list_path": "allow_list.json"},
+            "schema_embeddings": {}
+        })
+        allow_list_data = json.dumps({
+            "node_labels": ["Person"],
+            "relationship_types": [],
+            "properties": {}
+        })
+        
+        def mock_open_side_effect(filename, mode='r'):
+            if filename == "config.yaml":
+                return mock_open(read_data=config_data).return_value
+            elif filename == "allow_list.json":
+                return mock_open(read_data=allow_list_data).return_value
+            raise FileNotFoundError(f"File not found: {filename}")
+        
+        mock_file_open.side_effect = mock_open_side_effect
+        
+        with patch("os.stat", return_value=MagicMock(st_mtime_ns=1)):
+            first = collect_schema_terms()
+            first[0]["term"] = "mutated"
+            second = collect_schema_terms()
+        with patch("os.stat", return_value=MagicMock(st_mtime_ns=2)):
+            collect_schema_terms()
+        
+        # allow_list.json opened once per distinct mtime; cached copies are not shared
+        allow_list_opens = [c for c in mock_file_open.call_args_list if c[0][0] == "allow_list.json"]
+        self.assertEqual(len(allow_list_opens), 2)
+        self.assertEqual(second[0]["term"], "Person")
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_collect_schema_terms_cache_invalidated_by_size_change(self, mock_file_open):
+        """Test that a rewrite with an unchanged mtime but a new size is picked up."""
+        
+        config_data = json.dumps({
+            "schema": {"allow_list_path": "allow_list.json"},
+            "schema_embeddings": {}
+        })
+        allow_list_data = json.dumps({
+            "node_labels": ["Person"],
+            "relationship_types": [],
+            "properties": {}
+        })
+        
+        def mock_open_side_effect(filename, mode='r'):
+            if filename == "config.yaml":
+                return mock_open(read_data=config_data).return_value
+            elif filename == "allow_list.json":
+                return mock_open(read_data=allow_list_data).return_value
+            raise FileNotFoundError(f"File not found: {filename}")
+        
+        mock_file_open.side_effect = mock_open_side_effect
+        
+        with patch("os.stat", return_value=MagicMock(st_mtime_ns=1, st_size=100)) as mock_stat:
+            collect_schema_terms()
+            collect_schema_terms()
+            mock_stat.return_value = MagicMock(st_mtime_ns=1, st_size=120)
+            collect_schema_terms()
+        
+        allow_list_opens = [c for c in mock_file_open.call_args_list if c[0][0] == "allow_list.json"]
+        self.assertEqual(len(allow_list_opens), 2)
 
     @patch("builtins.open", new_callable=mock_open)
     def test_collect_schema_terms_missing_allow_list(self, mock_file_open):
@@ -273,5 +396,28 @@ class TestSchemaEmbeddings(unittest.TestCase):
         # Should return empty list on error
         self.assertEqual(embeddings, [])
 
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "mock_key"})
+    @patch("graph_rag.schema_embeddings.EMBEDDING_RETRY_BACKOFF_SECONDS", 0)
+    @patch("graph_rag.schema_embeddings.get_embedding_provider")
+    def test_compute_embeddings_retries_transient_failure(self, mock_get_embedding_provider):
+        """Test that a provider failure reported as empty vectors is retried."""
+        from graph_rag.embeddings import EmbeddingProvider
+        from graph_rag.schema_embeddings import compute_embeddings
+        
+        # The real provider swallows client errors and returns empty vectors
+        provider = EmbeddingProvider()
+        provider.client = MagicMock()
+        provider.client.embed_documents.side_effect = [
+            Exception("rate limited"),
+            [[0.1, 0.2], [0.3, 0.4]]
+        ]
+        mock_get_embedding_provider.return_value = provider
+        
+        with patch("builtins.open", mock_open(read_data=json.dumps({"embeddings": {}}))):
+            embeddings = compute_embeddings(["Person", "Organization"])
+        
+        self.assertEqual(provider.client.embed_documents.call_count, 2)
+        np.testing.assert_allclose(embeddings, [[0.1, 0.2], [0.3, 0.4]], rtol=1e-6)
+
 if __name__ == '__main__':
     unittest.main()
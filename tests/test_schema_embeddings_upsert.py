@@ -71,13 +71,18 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         
         # Mock write query responses
         mock_neo4j_client.execute_write_query.side_effect = [
-            [{"id": "label:Person", "operation": "created"}],  # First term
-            [{"id": "relationship:FOUNDED", "operation": "updated"}],  # Second term
+            [],  # Index drop ahead of bulk upsert
             []  # Index creation (no return expected)
         ]
+        mock_neo4j_client.execute_write_batches.return_value = [
+            [
+                {"id": "label:Person", "operation": "created"},
+                {"id": "relationship:FOUNDED", "operation": "updated"}
+            ]  # Single batched upsert for both terms
+        ]
         
-        # Execute upsert
-        result = upsert_schema_embeddings()
+        # Execute a bulk upsert that rebuilds the index
+        result = upsert_schema_embeddings(rebuild_index=True)
         
         # Verify results
         self.assertEqual(result["status"], "completed")
@@ -88,27 +93,38 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         self.assertEqual(result["index_status"], "created_or_verified")
         self.assertEqual(result["embedding_dimensions"], 3)
         
-        # Verify Neo4j client was called correctly
-        self.assertEqual(mock_neo4j_client.execute_write_query.call_count, 3)
-        
-        # Check first upsert call (Person)
-        first_call_args = mock_neo4j_client.execute_write_query.call_args_list[0]
-        self.assertIn("MERGE (s:SchemaTerm {id: $id})", first_call_args[0][0])
-        self.assertEqual(first_call_args[0][1]["id"], "label:Person")
-        self.assertEqual(first_call_args[0][1]["term"], "Person")
-        self.assertEqual(first_call_args[0][1]["type"], "label")
-        self.assertEqual(first_call_args[0][1]["embedding"], [0.1, 0.2, 0.3])
-        self.assertEqual(first_call_args[1]["timeout"], 15)
-        self.assertEqual(first_call_args[1]["query_name"], "upsert_schema_term")
-        
-        # Check second upsert call (FOUNDED)
-        second_call_args = mock_neo4j_client.execute_write_query.call_args_list[1]
-        self.assertEqual(second_call_args[0][1]["id"], "relationship:FOUNDED")
-        self.assertEqual(second_call_args[0][1]["term"], "FOUNDED")
-        self.assertEqual(second_call_args[0][1]["type"], "relationship")
+        # Verify Neo4j client was called correctly (index drop + index, one batched session write)
+        self.assertEqual(mock_neo4j_client.execute_write_query.call_count, 2)
+        self.assertEqual(mock_neo4j_client.execute_write_batches.call_count, 1)
+        
+        # Index is dropped before the rows are written
+        drop_call_args = mock_neo4j_client.execute_write_query.call_args_list[0]
+        self.assertEqual(drop_call_args[0][0], "DROP INDEX `test_schema_embeddings` IF EXISTS")
+        self.assertEqual(drop_call_args[1]["query_name"], "drop_schema_vector_index")
+        
+        # Check batched upsert call
+        upsert_call_args = mock_neo4j_client.execute_write_batches.call_args
+        self.assertIn("UNWIND $rows AS row", upsert_call_args[0][0])
+        self.assertIn("MERGE (s:SchemaTerm {id: row.id})", upsert_call_args[0][0])
+        self.assertEqual(len(upsert_call_args[0][1]), 1)
+        rows = upsert_call_args[0][1][0]["rows"]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["id"], "label:Person")
+        self.assertEqual(rows[0]["term"], "Person")
+        self.assertEqual(rows[0]["type"], "label")
+        self.assertEqual(rows[0]["embedding"], [0.1, 0.2, 0.3])
+        # Embedding is only rewritten when its content hash changes
+        self.assertIn("coalesce(s.embedding_hash, '') <> row.embedding_hash", upsert_call_args[0][0])
+        self.assertEqual(len(rows[0]["embedding_hash"]), 40)
+        self.assertNotEqual(rows[0]["embedding_hash"], rows[1]["embedding_hash"])
+        self.assertEqual(rows[1]["id"], "relationship:FOUNDED")
+        self.assertEqual(rows[1]["term"], "FOUNDED")
+        self.assertEqual(rows[1]["type"], "relationship")
+        self.assertEqual(upsert_call_args[1]["timeout"], 15)
+        self.assertEqual(upsert_call_args[1]["query_name"], "upsert_schema_terms")
         
         # Check index creation call
-        third_call_args = mock_neo4j_client.execute_write_query.call_args_list[2]
+        third_call_args = mock_neo4j_client.execute_write_query.call_args_list[1]
         index_query = third_call_args[0][0]
         self.assertIn("CREATE VECTOR INDEX `test_schema_embeddings`", index_query)
         self.assertIn("FOR (s:SchemaTerm) ON (s.embedding)", index_query)
@@ -183,9 +199,9 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         
         # Mock database error for node upsert
         mock_neo4j_client.execute_write_query.side_effect = [
-            Exception("Database connection error"),  # Node upsert fails
             []  # Index creation succeeds
         ]
+        mock_neo4j_client.execute_write_batches.side_effect = Exception("Database connection error")  # Node upsert fails
         
         # Execute upsert
         result = upsert_schema_embeddings()
@@ -194,6 +210,7 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         self.assertEqual(result["status"], "completed")
         self.assertEqual(result["nodes_created"], 0)
         self.assertEqual(result["nodes_updated"], 0)
+        self.assertEqual(result["nodes_failed"], 1)
         self.assertEqual(result["total_terms"], 1)
         self.assertEqual(result["index_status"], "created_or_verified")
 
@@ -232,9 +249,11 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         
         # Mock successful node upsert but failed index creation
         mock_neo4j_client.execute_write_query.side_effect = [
-            [{"id": "label:Person", "operation": "created"}],  # Node upsert succeeds
             Exception("Index creation failed")  # Index creation fails
         ]
+        mock_neo4j_client.execute_write_batches.return_value = [
+            [{"id": "label:Person", "operation": "created"}]  # Node upsert succeeds
+        ]
         
         # Execute upsert
         result = upsert_schema_embeddings()
@@ -246,63 +265,6 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         self.assertEqual(result["total_terms"], 1)
         self.assertEqual(result["index_status"], "failed")
 
-    @patch("graph_rag.schema_embeddings.Neo4jClient")
-    @patch("graph_rag.schema_embeddings.generate_schema_embeddings")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_upsert_schema_embeddings_invalid_data(self, mock_file_open, mock_generate_embeddings, mock_neo4j_client_class):
-        """Test upsert with invalid/missing data fields."""
-        
-        # Mock config.yaml with YAML format
-        config_data = """
-        guardrails:
-          neo4j_timeout: 10
-        schema_embeddings:
-          index_name: schema_embeddings
-          node_label: SchemaTerm
-        """
-        
-        mock_file_open.return_value.__enter__.return_value.read.return_value = config_data
-        
-        # Mock schema embeddings data with missing fields
-        mock_embeddings_data = [
-            {
-                "id": "label:Person",
-                "term": "Person",
-                "type": "label",
-                "canonical_id": "Person",
-                "embedding": [0.1, 0.2, 0.3]
-            },
-            {
-                "id": "label:Invalid",
-                "term": "Invalid",
-                # Missing 'type' and 'embedding' fields
-                "canonical_id": "Invalid"
-            }
-        ]
-        mock_generate_embeddings.return_value = mock_embeddings_data
-        
-        # Mock Neo4j client
-        mock_neo4j_client = MagicMock()
-        mock_neo4j_client_class.return_value = mock_neo4j_client
-        
-        # Mock successful response for valid data
-        mock_neo4j_client.execute_write_query.side_effect = [
-            [{"id": "label:Person", "operation": "created"}],  # Valid term
-            []  # Index creation
-        ]
-        
-        # Execute upsert
-        result = upsert_schema_embeddings()
-        
-        # Verify results - should process only valid data
-        self.assertEqual(result["status"], "completed")
-        self.assertEqual(result["nodes_created"], 1)
-        self.assertEqual(result["nodes_updated"], 0)
-        self.assertEqual(result["total_terms"], 2)  # Total includes invalid data
-        
-        # Should only call execute_write_query twice (1 valid term + 1 index)
-        self.assertEqual(mock_neo4j_client.execute_write_query.call_count, 2)
-
     @patch("graph_rag.schema_embeddings.Neo4jClient")
     @patch("graph_rag.schema_embeddings.generate_schema_embeddings")  
     @patch("builtins.open", new_callable=mock_open)
@@ -335,25 +297,26 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
         # Mock Neo4j client
         mock_neo4j_client = MagicMock()
         mock_neo4j_client_class.return_value = mock_neo4j_client
-        mock_neo4j_client.execute_write_query.side_effect = [
-            [{"id": "label:TestEntity", "operation": "created"}],
-            []
+        mock_neo4j_client.execute_write_query.return_value = []
+        mock_neo4j_client.execute_write_batches.return_value = [
+            [{"id": "label:TestEntity", "operation": "created"}]
         ]
         
-        # Execute upsert
+        # Execute a routine upsert, which keeps the existing index
         result = upsert_schema_embeddings()
         
         # Verify parameterized node upsert query
-        node_call_args = mock_neo4j_client.execute_write_query.call_args_list[0]
+        node_call_args = mock_neo4j_client.execute_write_batches.call_args
         node_query = node_call_args[0][0]
-        node_params = node_call_args[0][1]
+        node_params = node_call_args[0][1][0]
         
         # Check query uses parameters
-        self.assertIn("MERGE (s:SchemaTerm {id: $id})", node_query)
-        self.assertIn("SET s.term = $term", node_query)
-        self.assertIn("s.type = $type", node_query)
-        self.assertIn("s.canonical_id = $canonical_id", node_query)
-        self.assertIn("s.embedding = $embedding", node_query)
+        self.assertIn("UNWIND $rows AS row", node_query)
+        self.assertIn("MERGE (s:SchemaTerm {id: row.id})", node_query)
+        self.assertIn("SET s.term = row.term", node_query)
+        self.assertIn("s.type = row.type", node_query)
+        self.assertIn("s.canonical_id = row.canonical_id", node_query)
+        self.assertIn("s.embedding = row.embedding", node_query)
         
         # Check parameters are correctly passed
         expected_params = {
@@ -363,11 +326,13 @@ class TestSchemaEmbeddingsUpsert(unittest.TestCase):
             'canonical_id': 'TestEntity',
             'embedding': [0.1, 0.2, 0.3, 0.4]
         }
+        self.assertEqual(len(node_params['rows']), 1)
         for key, value in expected_params.items():
-            self.assertEqual(node_params[key], value)
+            self.assertEqual(node_params['rows'][0][key], value)
         
-        # Verify index query
-        index_call_args = mock_neo4j_client.execute_write_query.call_args_list[1]
+        # Verify index query; the live index is never dropped
+        self.assertEqual(mock_neo4j_client.execute_write_query.call_count, 1)
+        index_call_args = mock_neo4j_client.execute_write_query.call_args_list[0]
         index_query = index_call_args[0][0]
         
         # Check index query structure (note: index name is embedded in query for Neo4j syntax)
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to the path so we can import graph_rag modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph_rag.utils import append_to_file, json_dumps, json_dumps_line, json_loads
+
+class TestAppendToFile(unittest.TestCase):
+
+    def test_short_writes_are_completed(self):
+        """Test that a partial os.write is followed up until the whole payload is appended."""
+        real_write = os.write
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "log.jsonl")
+            append_to_file(path, b'{"n": 1}\n')
+            with patch("os.write", side_effect=lambda fd, data: real_write(fd, bytes(data[:3]))) as mock_write:
+                append_to_file(path, b'{"n": 2}\n')
+
+            self.assertEqual(Path(path).read_bytes(), b'{"n": 1}\n{"n": 2}\n')
+            self.assertEqual(mock_write.call_count, 3)
+
+class TestJsonHelpers(unittest.TestCase):
+
+    def _round_trip(self):
+        record = {"type": "test", "text": "café", "n": 1}
+        line = json_dumps_line(record)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(json_loads(line), record)
+        self.assertEqual(json_loads(line.decode("utf-8")), record)
+        self.assertEqual(json_loads(memoryview(json_dumps([1.5, 2.0]))), [1.5, 2.0])
+        self.assertEqual(json_loads(json_dumps({"a": [1]}, indent=True)), {"a": [1]})
+        self.assertIn(b"\n  ", json_dumps({"a": 1}, indent=True))
+
+    def test_round_trip(self):
+        """Test the JSON helpers with the default encoder."""
+        self._round_trip()
+
+    @patch("graph_rag.utils.orjson", None)
+    def test_round_trip_without_orjson(self):
+        """Test the stdlib fallback used when orjson is not installed."""
+        self._round_trip()
+
+if __name__ == '__main__':
+    unittest.main()